@@ -6,12 +6,27 @@ import re
 import json
 import time
 import shutil
+import atexit
+import threading
 import unicodedata
+import functools
+import hashlib
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from datetime import datetime
 import fnmatch
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster (de)serialization of caches/API payloads
+except ImportError:
+    orjson = None
 
 SCRIPT_DIR = Path(__file__).resolve().parent
 
@@ -19,23 +34,32 @@ VARS_FILE = str(SCRIPT_DIR / "VOD2strm_vars.sh")
 
 # Global current Dispatcharr token (used for auto re-auth on 401)
 _CURRENT_TOKEN: str | None = None
+# Serializes 401 re-logins so concurrent workers don't each log in again
+_LOGIN_LOCK = threading.Lock()
 
 # ------------------------------
 # Helpers: load vars from .sh
 # ------------------------------
 
 
+# KEY="value" / KEY='value' / KEY=value, optionally prefixed with "export "
+VAR_LINE_PATTERN = re.compile(
+    r"""^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"([^"]*)"|'([^']*)'|(.*?))\s*$"""
+)
+
+
 def load_vars(path: str) -> dict:
     env = {}
     p = Path(path)
     if not p.exists():
         return env
     for line in p.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
+        m = VAR_LINE_PATTERN.match(line)
+        if not m:
+            # blank lines, comments, anything that is not an assignment
             continue
-        k, v = line.split("=", 1)
-        env[k.strip()] = v.strip().strip('"').strip("'")
+        k, dq, sq, bare = m.groups()
+        env[k] = dq if dq is not None else (sq if sq is not None else bare)
     return env
 
 
@@ -77,6 +101,8 @@ else:
 
 # Log level / verbosity controller (for progress percentage lines)
 LOG_LEVEL = (os.getenv("LOG_LEVEL") or VARS.get("LOG_LEVEL", "INFO")).upper()
+_VERBOSE = LOG_LEVEL in ("DEBUG", "VERBOSE")
+_PROGRESS = LOG_LEVEL in ("DEBUG", "VERBOSE", "INFO")
 
 # NFO / TMDB
 ENABLE_NFO = VARS.get("ENABLE_NFO", "false").lower() == "true"
@@ -84,6 +110,10 @@ OVERWRITE_NFO = VARS.get("OVERWRITE_NFO", "false").lower() == "true"
 TMDB_API_KEY = VARS.get("TMDB_API_KEY", "").strip()
 NFO_LANG = VARS.get("NFO_LANG", "en-US")
 TMDB_THROTTLE_SEC = float(VARS.get("TMDB_THROTTLE_SEC", "0.3"))
+try:
+    TMDB_BURST = max(1, int(os.getenv("TMDB_BURST") or VARS.get("TMDB_BURST", "5")))
+except ValueError:
+    TMDB_BURST = 5
 
 # Cache base
 CACHE_BASE_DIR = Path(VARS.get("CACHE_DIR") or str(SCRIPT_DIR / "cache"))
@@ -116,17 +146,49 @@ ENABLE_XC_EPISODE_FALLBACK = (os.getenv("ENABLE_XC_EPISODE_FALLBACK") or VARS.ge
 # ------------------------------------------------------------
 # Logging
 # ------------------------------------------------------------
+# Log file handle is opened once (lazily) and flushed at most every
+# LOG_FLUSH_SEC seconds instead of open/write/close per line.
+LOG_FLUSH_SEC = 1.0
+_LOG_FH = None
+_LOG_LAST_FLUSH = 0.0
+_LOG_LOCK = threading.Lock()
+# (epoch second, formatted timestamp): reformat only when the second changes.
+# Swapped as a whole tuple so worker threads never see a torn pair.
+_TS_CACHE = (0, "")
+
+
+def _close_log() -> None:
+    global _LOG_FH
+    with _LOG_LOCK:
+        if _LOG_FH is not None:
+            _LOG_FH.close()
+            _LOG_FH = None
+
+
 def log(msg: str) -> None:
-    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    global _LOG_FH, _LOG_LAST_FLUSH, _TS_CACHE
+    sec = int(time.time())
+    cached_sec, ts = _TS_CACHE
+    if sec != cached_sec:
+        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+        _TS_CACHE = (sec, ts)
     line = f"[{ts}] {msg}"
-    print(line)
-    Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
+    with _LOG_LOCK:
+        # Under the lock: print() from parallel exporters would interleave
+        print(line)
+        if _LOG_FH is None:
+            Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+            _LOG_FH = open(LOG_FILE, "a", buffering=1 << 14, encoding="utf-8")
+            atexit.register(_close_log)
+        _LOG_FH.write(line + "\n")
+        now = time.monotonic()
+        if now - _LOG_LAST_FLUSH >= LOG_FLUSH_SEC:
+            _LOG_FH.flush()
+            _LOG_LAST_FLUSH = now
 
 
 def log_debug(msg: str) -> None:
-    if LOG_LEVEL in ("DEBUG", "VERBOSE"):
+    if _VERBOSE:
         log(msg)
 
 
@@ -138,12 +200,9 @@ def log_progress(msg: str) -> None:
       - DEBUG / VERBOSE / INFO -> show progress lines
       - WARN / ERROR / QUIET   -> hide progress lines
     """
-    level = LOG_LEVEL
-    if level in ("DEBUG", "VERBOSE", "INFO"):
+    # Quiet/minimal modes skip noisy percentage logs
+    if _PROGRESS:
         log(msg)
-    else:
-        # Quiet/minimal modes: skip noisy percentage logs
-        return
 
 
 # ------------------------------------------------------------
@@ -159,23 +218,71 @@ def parse_xc_patterns(raw: str):
 XC_PATTERNS = parse_xc_patterns(XC_NAMES_RAW)
 
 
+@functools.lru_cache(maxsize=None)
+def compile_xc_patterns(patterns: tuple) -> re.Pattern:
+    """Translate the fnmatch-style patterns once into a single alternation."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
 def match_account_name(name: str, patterns) -> bool:
     if not patterns:
         return True
-    for pat in patterns:
-        if fnmatch.fnmatch(name, pat):
-            return True
-    return False
+    return compile_xc_patterns(tuple(patterns)).match(name) is not None
+
+
+# ------------------------------------------------------------
+# JSON helpers (orjson if installed, stdlib json otherwise)
+# ------------------------------------------------------------
+def json_loads_bytes(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    if orjson is not None:
+        # NON_STR_KEYS: accept int keys (e.g. season numbers) like json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode("utf-8")
 
 
 # ------------------------------------------------------------
 # HTTP helpers
 # ------------------------------------------------------------
-def request_headers(token: str | None = None) -> dict:
-    headers = {
-        "Accept": "application/json",
+def make_session(
+    backoff_factor: float = 0.3,
+    status_forcelist: tuple = (502, 503, 504),
+) -> requests.Session:
+    """
+    Build a pooled requests.Session (HTTP keep-alive) shared by all
+    Dispatcharr and XC calls, with a small retry budget for gateway errors.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(status_forcelist),
+            raise_on_status=False,  # hand the final response back to the caller
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({
         "User-Agent": HTTP_USER_AGENT,
-    }
+        "Accept": "application/json",
+    })
+    return session
+
+
+_SESSION = make_session()
+
+
+def request_headers(token: str | None = None) -> dict:
+    # User-Agent / Accept are session defaults; only auth varies per call
+    headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
     return headers
@@ -183,11 +290,10 @@ def request_headers(token: str | None = None) -> dict:
 
 def api_login(base_url: str, username: str, password: str) -> str:
     url = f"{base_url.rstrip('/')}/api/accounts/token/"
-    resp = requests.post(
+    resp = _SESSION.post(
         url,
         json={"username": username, "password": password},
         timeout=30,
-        headers={"User-Agent": HTTP_USER_AGENT},
     )
     if resp.status_code != 200:
         raise RuntimeError(f"Login failed ({resp.status_code}): {resp.text}")
@@ -204,13 +310,14 @@ def api_get(base_url: str, token: str, path: str, params: dict | None = None):
 
     - Uses the provided token, but prefers the global _CURRENT_TOKEN if set.
     - On 401, attempts a single re-login using DISPATCHARR_API_USER/PASS,
-      updates _CURRENT_TOKEN, and retries once.
+      updates _CURRENT_TOKEN, and retries once. If another thread already
+      refreshed the token meanwhile, that token is reused instead.
     """
     global _CURRENT_TOKEN
 
     def do_request(t: str | None):
         url = f"{base_url.rstrip('/')}{path}"
-        resp = requests.get(
+        resp = _SESSION.get(
             url,
             headers=request_headers(t),
             params=params or {},
@@ -224,14 +331,19 @@ def api_get(base_url: str, token: str, path: str, params: dict | None = None):
 
     # Handle 401: try to re-login once, then retry
     if resp.status_code == 401:
-        log("WARNING: 401 Unauthorized from Dispatcharr API – attempting re-login once.")
-        try:
-            new_token = api_login(DISPATCHARR_BASE_URL, DISPATCHARR_API_USER, DISPATCHARR_API_PASS)
-        except Exception as e:
-            log(f"ERROR: re-login failed after 401: {e}")
-            return None
-
-        _CURRENT_TOKEN = new_token
+        with _LOGIN_LOCK:
+            if _CURRENT_TOKEN and _CURRENT_TOKEN != use_token:
+                new_token = _CURRENT_TOKEN
+            else:
+                log("WARNING: 401 Unauthorized from Dispatcharr API – attempting re-login once.")
+                try:
+                    new_token = api_login(
+                        DISPATCHARR_BASE_URL, DISPATCHARR_API_USER, DISPATCHARR_API_PASS
+                    )
+                except Exception as e:
+                    log(f"ERROR: re-login failed after 401: {e}")
+                    return None
+                _CURRENT_TOKEN = new_token
         url, resp = do_request(new_token)
 
         if resp.status_code == 401:
@@ -240,7 +352,7 @@ def api_get(base_url: str, token: str, path: str, params: dict | None = None):
             return None
 
     # Only log successful API GETs at higher verbosity; always log errors separately below.
-    if LOG_LEVEL in ("DEBUG", "VERBOSE"):
+    if _VERBOSE:
         log(f"API GET {url} -> {resp.status_code}")
 
     if not resp.ok:
@@ -250,7 +362,8 @@ def api_get(base_url: str, token: str, path: str, params: dict | None = None):
     if not resp.content:
         return None
     try:
-        return resp.json()
+        # Parse the raw bytes directly (skips requests' charset detection + .text decode)
+        return json_loads_bytes(resp.content)
     except ValueError:
         # Not JSON, return raw text
         return resp.text
@@ -273,84 +386,89 @@ def api_paginate(base_url: str, token: str, path: str, page_size: int = 250, max
     seen = 0
     next_progress_pct = 10  # for DEBUG/VERBOSE pagination logs
 
-    while True:
-        # If we already hit the limit, stop before calling the API again
-        if max_items is not None and seen >= max_items:
-            break
+    sep = "&" if "?" in path else "?"
 
-        sep = "&" if "?" in path else "?"
-        full_path = f"{path}{sep}page={page}&page_size={page_size}"
+    def fetch_page(n: int):
+        return api_get(base_url, token, f"{path}{sep}page={n}&page_size={page_size}")
 
-        data = api_get(base_url, token, full_path)
-        if data is None:
-            break
-
-        if isinstance(data, dict):
-            results = data.get("results") or data.get("data") or data.get("items") or []
-            if total is None:
-                total = data.get("count") or len(results)
-                # If we have a max_items cap, clamp total for logging
-                if max_items is not None and total:
-                    total = min(total, max_items)
-                # Only show pagination start at higher verbosity
-                if LOG_LEVEL in ("DEBUG", "VERBOSE"):
-                    log_progress(f"Pagination start for {path}: total={total}")
-        else:
-            results = data
-            if total is None:
-                total = None
+    # One-deep prefetch: page N+1 is requested while the caller consumes page N.
+    ex = ThreadPoolExecutor(max_workers=1)
+    pending = ex.submit(fetch_page, page)
+    try:
+        while True:
+            data = pending.result()
+            pending = None
+            if data is None:
+                break
 
-        if not results:
-            break
+            if isinstance(data, dict):
+                results = data.get("results") or data.get("data") or data.get("items") or []
+                if total is None:
+                    total = data.get("count") or len(results)
+                    # If we have a max_items cap, clamp total for logging
+                    if max_items is not None and total:
+                        total = min(total, max_items)
+                    # Only show pagination start at higher verbosity
+                    if _VERBOSE:
+                        log_progress(f"Pagination start for {path}: total={total}")
+            else:
+                results = data
 
-        # Apply max_items cap to this page
-        if max_items is not None:
-            remaining = max_items - seen
-            if remaining <= 0:
+            if not results:
                 break
-            if len(results) > remaining:
-                results = results[:remaining]
-
-        # After any truncation, update seen count
-        seen += len(results)
-
-        if total:
-            pct = (seen * 100) // total
-            # Only show per-page pagination updates at higher verbosity
-            if LOG_LEVEL in ("DEBUG", "VERBOSE"):
-                # First chunk, final chunk, or on/after the next 10% threshold
-                if seen == len(results) or seen >= total or pct >= next_progress_pct:
+
+            # Apply max_items cap to this page
+            if max_items is not None:
+                remaining = max_items - seen
+                if remaining <= 0:
+                    break
+                if len(results) > remaining:
+                    results = results[:remaining]
+
+            # After any truncation, update seen count
+            seen += len(results)
+
+            if total:
+                pct = (seen * 100) // total
+                # Only show per-page pagination updates at higher verbosity
+                if _VERBOSE:
+                    # First chunk, final chunk, or on/after the next 10% threshold
+                    if seen == len(results) or seen >= total or pct >= next_progress_pct:
+                        log_progress(
+                            f"Pagination {path}: page={page}, "
+                            f"{seen}/{total} ({pct}%) items fetched"
+                        )
+                        while next_progress_pct <= pct and next_progress_pct < 100:
+                            next_progress_pct += 10
+            else:
+                if _VERBOSE:
                     log_progress(
                         f"Pagination {path}: page={page}, "
-                        f"{seen}/{total} ({pct}%) items fetched"
+                        f"{seen} items fetched (total unknown)"
                     )
-                    while next_progress_pct <= pct and next_progress_pct < 100:
-                        next_progress_pct += 10
-        else:
-            if LOG_LEVEL in ("DEBUG", "VERBOSE"):
-                log_progress(
-                    f"Pagination {path}: page={page}, "
-                    f"{seen} items fetched (total unknown)"
-                )
 
-        # Yield the (possibly truncated) page
-        if results:
-            yield results
+            # Is there a next page? (cap reached, no "next" link, or short list page)
+            if max_items is not None and seen >= max_items:
+                has_next = False
+            elif isinstance(data, dict):
+                has_next = bool(data.get("next"))
+            else:
+                has_next = len(results) >= page_size
 
-        # If we hit the cap exactly, stop here
-        if max_items is not None and seen >= max_items:
-            break
+            # Kick off the next request before handing this page to the caller
+            if has_next:
+                pending = ex.submit(fetch_page, page + 1)
 
-        # Check for next page
-        if isinstance(data, dict):
-            next_url = data.get("next")
-            if not next_url:
-                break
-        else:
-            if len(results) < page_size:
-                break
+            # Yield the (possibly truncated) page
+            yield results
 
-        page += 1
+            if not has_next:
+                break
+            page += 1
+    finally:
+        if pending is not None:
+            pending.cancel()
+        ex.shutdown(wait=False)
 
 
 # ------------------------------------------------------------
@@ -366,21 +484,29 @@ def strip_tags(title: str) -> str:
     return TAG_PATTERN.sub("", title)
 
 
+# Titles repeat heavily (show names, "Episode N", genres), so memoize the
+# pure string helpers below.
+@functools.lru_cache(maxsize=65536)
 def normalize_title(title: str) -> str:
     if not title:
         return ""
-    title = unicodedata.normalize("NFKC", title)
-    title = strip_tags(title)
-    title = re.sub(r"\s+", " ", title).strip(" -._")
-    return title
+    # ASCII is already NFKC-normal: skip the normalizer for the common case
+    if not title.isascii():
+        title = unicodedata.normalize("NFKC", title)
+    # str.split() collapses whitespace runs (same set as regex \s) in C
+    return " ".join(strip_tags(title).split()).strip(" -._")
 
 
 FS_SAFE_PATTERN = re.compile(r'[\\/:*?"<>|]+')
+FS_UNSAFE_CHARS = frozenset('\\/:*?"<>|')
 
 
+@functools.lru_cache(maxsize=65536)
 def fs_safe(name: str) -> str:
     name = name.strip()
-    name = FS_SAFE_PATTERN.sub("_", name)
+    # Most names are already clean: a C-level set check skips the regex pass
+    if not FS_UNSAFE_CHARS.isdisjoint(name):
+        name = FS_SAFE_PATTERN.sub("_", name)
     name = name.strip(" .")
     if not name:
         name = "_"
@@ -394,28 +520,117 @@ def safe_account_name(name: str) -> str:
 # ------------------------------------------------------------
 # Tiny FS helpers
 # ------------------------------------------------------------
-def mkdir(path: Path) -> None:
+# Directories already created this run: every STRM/NFO write calls mkdir()
+# on its parent, so skip the repeated mkdir syscalls.
+_CREATED_DIRS: set[str] = set()
+
+
+def mkdir(path: Path | str) -> None:
     """Create directory unless dry-run mode is active."""
     if DRY_RUN:
         log(f"[dry-run] Would create directory: {path}")
         return
-    path.mkdir(parents=True, exist_ok=True)
+    key = str(path)
+    if key in _CREATED_DIRS:
+        return
+    os.makedirs(key, exist_ok=True)
+    _CREATED_DIRS.add(key)
 
 
-def write_text_atomic(path: Path, content: str) -> None:
+def write_bytes_atomic(path: Path | str, data: bytes) -> None:
+    """
+    Write a pre-serialized buffer to a temp file with a single os.write()
+    (no FILE* buffering), then os.replace() it into place.
+
+    Low-level: no dry-run check and no mkdir; callers handle both.
+    """
+    tmp = f"{path}.{threading.get_ident()}.tmp"  # per-thread: exporters run in parallel
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def write_text_atomic(path: Path | str, content: str) -> None:
     """Safely write text unless dry-run mode is active."""
     if DRY_RUN:
         log(f"[dry-run] Would write file: {path}")
         return
-    mkdir(path.parent)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        f.write(content)
-    os.replace(tmp, path)
+    mkdir(os.path.dirname(path))
+    write_bytes_atomic(path, content.encode("utf-8"))
 
 
-def write_strm(path: Path, url: str) -> None:
-    write_text_atomic(path, f"{url}\n")
+def join_path(dir_str: str, name: str) -> str:
+    """
+    os.path.join for per-episode hot loops (no Path objects). Names that
+    contain a separator go through Path so the result is normalized exactly
+    as before (cleanup compares these strings with os.walk output).
+    """
+    if "/" in name or os.sep in name:
+        return str(Path(dir_str, name))
+    return os.path.join(dir_str, name)
+
+
+def link_or_copy(src: Path, dest: Path) -> None:
+    """
+    Hardlink src to dest (no data copy); fall back to copying when linking
+    isn't possible (e.g. cache and library on different filesystems).
+    """
+    try:
+        if os.path.samefile(src, dest):
+            return  # already linked on a previous run
+        dest.unlink()
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+
+
+def write_strm(path: Path | str, url: str) -> str:
+    """Write a STRM if needed; returns "added", "updated" or "unchanged"."""
+    data = f"{url}\n".encode("utf-8")
+    # Leave unchanged STRMs alone: a tiny read is cheaper than tmp+rename,
+    # and keeping the mtime avoids needless media-server rescans.
+    exists = True
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        exists = False
+    except OSError:
+        pass
+    else:
+        try:
+            if os.read(fd, len(data) + 1) == data:
+                return "unchanged"
+        finally:
+            os.close(fd)
+
+    status = "updated" if exists else "added"
+    if DRY_RUN:
+        log(f"[dry-run] Would write file: {path}")
+        return status
+    mkdir(os.path.dirname(path))
+    if not exists:
+        # New STRM: nobody can be reading it yet, so one create+write is
+        # enough (O_EXCL keeps a racing writer from being clobbered).
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+            return status
+    write_bytes_atomic(path, data)
+    return status
 
 
 def normalize_host_for_proxy(base: str) -> str:
@@ -463,8 +678,7 @@ def get_movies_for_account(base: str, token: str, account_id: int, page_size: in
         page_size=page_size,
         max_items=LIMIT_MOVIES,
     ):
-        for m in page:
-            yield m
+        yield from page
 
 
 # ------------------------------------------------------------
@@ -479,8 +693,7 @@ def get_series_for_account(base: str, token: str, account_id: int, page_size: in
         page_size=page_size,
         max_items=LIMIT_SERIES,
     ):
-        for s in page:
-            yield s
+        yield from page
 
 
 def api_get_series_provider_info(base: str, token: str, series_id: int) -> dict:
@@ -495,6 +708,23 @@ def api_get_series_provider_info(base: str, token: str, series_id: int) -> dict:
     return data
 
 
+# Provider-info is cached until CLEAR_CACHE by default; a TTL (hours) lets
+# re-runs pick up newly aired episodes without wiping every cache.
+try:
+    PROVIDER_INFO_TTL_HOURS = float(
+        os.getenv("PROVIDER_INFO_TTL_HOURS") or VARS.get("PROVIDER_INFO_TTL_HOURS", "0")
+    )
+except ValueError:
+    PROVIDER_INFO_TTL_HOURS = 0.0
+
+
+def provider_info_fresh(entry: Path | os.DirEntry) -> bool:
+    """True if a provider-info cache file is within its TTL (no stat when off)."""
+    if PROVIDER_INFO_TTL_HOURS <= 0:
+        return True
+    return time.time() - entry.stat().st_mtime < PROVIDER_INFO_TTL_HOURS * 3600
+
+
 def get_provider_info_cache_path(account_name: str, series_id: int) -> Path:
     safe_name = safe_account_name(account_name)
     return CACHE_BASE_DIR / safe_name / "provider-info" / f"{series_id}.json"
@@ -507,34 +737,49 @@ def provider_info_cached(base: str, token: str, account_name: str, series_id: in
     """
     cache_path = get_provider_info_cache_path(account_name, series_id)
 
-    # Try cached copy first
-    if cache_path.exists():
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            log(f"Failed to read provider-info cache for series_id={series_id} ({account_name}): {e}")
+    # Try cached copy first (read directly; a miss costs one failed open)
+    try:
+        if provider_info_fresh(cache_path):
+            return json_loads_bytes(cache_path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log(f"Failed to read provider-info cache for series_id={series_id} ({account_name}): {e}")
 
     # Fetch fresh provider-info from Dispatcharr
     info = api_get_series_provider_info(base, token, series_id)
     if not info:
+        # Failed refetch of an expired entry: keep using the stale copy rather
+        # than exporting zero episodes (and cleaning up the series' STRMs).
+        if PROVIDER_INFO_TTL_HOURS > 0:
+            try:
+                stale = json_loads_bytes(cache_path.read_bytes())
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                log(f"Failed to read provider-info cache for series_id={series_id} ({account_name}): {e}")
+            else:
+                log(
+                    f"Provider-info refetch failed for series_id={series_id} "
+                    f"({account_name}); using stale cache entry."
+                )
+                return stale
         return {}
 
     # Write/update cache
     try:
         if DRY_RUN:
             # Only log provider-info cache actions at higher verbosity.
-            if LOG_LEVEL in ("DEBUG", "VERBOSE"):
+            if _VERBOSE:
                 log(
                     f"[dry-run] Would write provider-info cache for series_id={series_id} "
                     f"({account_name}) to {cache_path}"
                 )
         else:
-            cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(info, f)
+            mkdir(cache_path.parent)
+            write_bytes_atomic(cache_path, json_dumps_bytes(info))
             # Only log saved-cache at DEBUG/VERBOSE.
-            if LOG_LEVEL in ("DEBUG", "VERBOSE"):
+            if _VERBOSE:
                 log(
                     f"Saved provider-info cache for series_id={series_id} "
                     f"({account_name}) to {cache_path}"
@@ -546,7 +791,179 @@ def provider_info_cached(base: str, token: str, account_name: str, series_id: in
     return info
 
 
-def normalize_provider_info(info: dict) -> dict:
+# Concurrent provider-info fetches per account (I/O bound, shares _SESSION pool;
+# values above its pool_maxsize just open extra short-lived connections)
+try:
+    PROVIDER_INFO_WORKERS = max(
+        1, int(os.getenv("PROVIDER_INFO_WORKERS") or VARS.get("PROVIDER_INFO_WORKERS", "16"))
+    )
+except ValueError:
+    PROVIDER_INFO_WORKERS = 16
+# Parallel readers for warm provider-info cache files
+PROVIDER_INFO_CACHE_READERS = 8
+# Series export runs in windows of about this many series: provider-info
+# for the next window is fetched while the current one is written, so raw
+# payloads are held for a few windows at a time rather than the whole catalog.
+PROVIDER_INFO_WINDOW = 256
+
+
+def list_provider_info_cache(account_name: str) -> dict[str, str]:
+    """
+    {file name: path} of the fresh entries in the account's provider-info
+    cache dir, from a single os.scandir() (empty if the dir doesn't exist).
+    """
+    cache_dir = CACHE_BASE_DIR / safe_account_name(account_name) / "provider-info"
+    try:
+        with os.scandir(cache_dir) as it:
+            return {e.name: e.path for e in it if provider_info_fresh(e)}
+    except FileNotFoundError:
+        return {}
+
+
+def prefetch_provider_info_cache(
+    account_name: str, series_ids, listing: dict[str, str] | None = None
+) -> dict:
+    """
+    Bulk-load cached provider-info for the given series ids.
+
+    One os.scandir() of the account's provider-info cache dir replaces a
+    stat+open per series (pass a list_provider_info_cache() result as
+    listing to reuse one scan across calls); matching files are read and
+    parsed on a small thread pool. Returns {series_id: info} for readable
+    cache hits only.
+    """
+    wanted = {f"{sid}.json": sid for sid in series_ids if sid is not None}
+    if not wanted:
+        return {}
+    if listing is None:
+        listing = list_provider_info_cache(account_name)
+    hits = [(sid, listing[name]) for name, sid in wanted.items() if name in listing]
+
+    def read(path: str):
+        try:
+            return json_loads_bytes(Path(path).read_bytes())
+        except Exception as e:
+            log_debug(f"Ignoring unreadable provider-info cache {path}: {e}")
+            return None
+
+    out = {}
+    with ThreadPoolExecutor(max_workers=PROVIDER_INFO_CACHE_READERS) as ex:
+        for (sid, _), info in zip(hits, ex.map(read, [path for _, path in hits])):
+            if isinstance(info, dict):
+                out[sid] = info
+    return out
+
+
+def prefetch_provider_info(
+    base: str,
+    token: str,
+    account_name: str,
+    series_list: list,
+    listing: dict[str, str] | None = None,
+) -> int:
+    """
+    Fetch provider-info for every series concurrently and stash the raw
+    payload on each series dict as "_provider_raw" so the export workers
+    never block on the network.
+
+    Warm cache entries are bulk-loaded first (prefetch_provider_info_cache);
+    only the remaining series hit the API (listing is passed through).
+    Expired entries go through provider_info_cached(), which falls back to
+    the stale copy if the refetch fails. Series whose fetch raised are
+    left untouched; fetch_series_with_fallback() will retry them inline.
+    Returns the number of series prefetched.
+    """
+    todo = [s for s in series_list if s.get("id") is not None and "_provider_raw" not in s]
+    if not todo:
+        return 0
+
+    cached = prefetch_provider_info_cache(account_name, [s.get("id") for s in todo], listing)
+    done = 0
+    if cached:
+        for s in todo:
+            info = cached.get(s.get("id"))
+            if info is not None:
+                s["_provider_raw"] = info
+                done += 1
+        todo = [s for s in todo if "_provider_raw" not in s]
+        log_debug(f"Provider-info cache hits for '{account_name}': {len(cached)}")
+
+    def fetch(s: dict):
+        try:
+            return provider_info_cached(base, token, account_name, s.get("id"))
+        except Exception as e:
+            log(f"Provider-info prefetch failed for series_id={s.get('id')} ({account_name}): {e}")
+            return None
+
+    if not todo:
+        return done
+    with ThreadPoolExecutor(max_workers=PROVIDER_INFO_WORKERS) as ex:
+        for s, info in zip(todo, ex.map(fetch, todo)):
+            if info is not None:
+                s["_provider_raw"] = info
+                done += 1
+    return done
+
+
+def _first(d: dict, *keys):
+    """Return the first truthy d[key] for key in keys, else None."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return None
+
+
+def _to_int(v, default: int = 0) -> int:
+    """
+    int(v) with a default, without raising. Ints and plain digit strings
+    (the common case) take a fast path that never enters try/except.
+    """
+    if type(v) is int:
+        return v
+    if isinstance(v, str) and v.isdecimal():
+        return int(v)
+    if v is None or v == "":
+        return default
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(slots=True)
+class Episode:
+    """One normalized episode (slotted: far smaller than a 6-key dict)."""
+    episode_num: int
+    title: str
+    stream_id: int | str | None
+    container_extension: str
+    direct_url: str
+
+
+# Episode-number key precedence: Dispatcharr payloads carry episode_number,
+# XC payloads carry episode_num.
+EP_NUM_KEYS = ("episode_number", "episode_num", "num")
+XC_EP_NUM_KEYS = ("episode_num", "episode_number", "num")
+
+
+def _mk_ep(e: dict, num_keys: tuple = EP_NUM_KEYS) -> Episode | None:
+    """Build an Episode from a raw provider/XC episode dict (None if unnumbered)."""
+    ep_num = _to_int(_first(e, *num_keys))
+    if not ep_num:
+        return None
+    return Episode(
+        ep_num,
+        _first(e, "title", "name", "episode_name") or f"Episode {ep_num}",
+        _first(e, "id", "stream_id"),
+        _first(e, "container_extension", "container") or "m3u8",
+        _first(e, "direct_url", "url") or "",
+    )
+
+
+def normalize_provider_info_indexed(
+    info: dict,
+) -> tuple[list[dict], dict[int, list[Episode]]]:
     """
     Normalize Dispatcharr/XC provider-info into a consistent layout:
 
@@ -554,16 +971,7 @@ def normalize_provider_info(info: dict) -> dict:
       "seasons": [
         {
           "number": 1,
-          "episodes": [
-            {
-              "episode_num": 1,
-              "title": "...",
-              "stream_id": ...,
-              "container_extension": "...",
-              "direct_url": "...",
-              "raw": {...}
-            }
-          ]
+          "episodes": [ Episode(episode_num=1, title="...", ...), ... ]
         }
       ]
     }
@@ -573,11 +981,20 @@ def normalize_provider_info(info: dict) -> dict:
         { "episodes": { "1": [ ... ], "2": [ ... ] } }
       - Flat "episodes" list (older / alternative formats)
       - XC-style "seasons" list (used by build_provider_info_from_xc)
+
+    Returns (seasons, episodes_by_season); the second is built in the same
+    pass and maps season number -> episodes (duplicate seasons merged).
     """
     if not info or not isinstance(info, dict):
-        return {"seasons": []}
+        return [], {}
 
     seasons: list[dict] = []
+    by_season: dict[int, list[Episode]] = {}
+
+    def add_season(s_num: int, eps: list[Episode]) -> None:
+        seasons.append({"number": s_num, "episodes": eps})
+        prev = by_season.get(s_num)
+        by_season[s_num] = eps if prev is None else prev + eps
 
     # --- Case 1: Dispatcharr-style episodes dict: { "1": [ep...], "2": [ep...] } ---
     episodes_obj = info.get("episodes")
@@ -585,185 +1002,73 @@ def normalize_provider_info(info: dict) -> dict:
         for season_key, ep_list in episodes_obj.items():
             if not isinstance(ep_list, list):
                 continue
-            try:
-                s_num = int(season_key)
-            except Exception:
+            s_num = _to_int(season_key, None)
+            if s_num is None:
                 # Fallback: try first episode's season_number
                 if ep_list and isinstance(ep_list[0], dict):
-                    s_num = ep_list[0].get("season_number") or 0
-                    try:
-                        s_num = int(s_num)
-                    except Exception:
-                        s_num = 0
+                    s_num = _to_int(ep_list[0].get("season_number"))
                 else:
                     s_num = 0
             if not s_num:
                 continue
 
-            norm_eps: list[dict] = []
+            norm_eps: list[Episode] = []
             for e in ep_list:
-                if not isinstance(e, dict):
-                    continue
-
-                ep_num = (
-                    e.get("episode_number")
-                    or e.get("episode_num")
-                    or e.get("num")
-                    or 0
-                )
-                try:
-                    ep_num = int(ep_num)
-                except Exception:
-                    ep_num = 0
-                if not ep_num:
-                    continue
-
-                title = (
-                    e.get("title")
-                    or e.get("name")
-                    or e.get("episode_name")
-                    or f"Episode {ep_num}"
-                )
-
-                stream_id = e.get("id") or e.get("stream_id")
-                cont = e.get("container_extension") or e.get("container") or "m3u8"
-                direct = e.get("direct_url") or e.get("url") or ""
-
-                norm_eps.append(
-                    {
-                        "episode_num": ep_num,
-                        "title": title,
-                        "stream_id": stream_id,
-                        "container_extension": cont,
-                        "direct_url": direct,
-                        "raw": e,
-                    }
-                )
+                if isinstance(e, dict) and (ep := _mk_ep(e)):
+                    norm_eps.append(ep)
 
             if norm_eps:
-                norm_eps.sort(key=lambda ep: ep.get("episode_num") or 0)
-                seasons.append({"number": s_num, "episodes": norm_eps})
+                norm_eps.sort(key=attrgetter("episode_num"))
+                add_season(s_num, norm_eps)
 
         if seasons:
-            seasons.sort(key=lambda s: s.get("number") or 0)
-            return {"seasons": seasons}
+            seasons.sort(key=itemgetter("number"))
+            return seasons, by_season
 
     # --- Case 2: flat "episodes" list ---
     if isinstance(episodes_obj, list) and episodes_obj:
-        seasons_by_number: dict[int, list[dict]] = {}
+        # Single pass into (season, episode, ep) tuples, one stable sort,
+        # then group consecutive seasons.
+        flat: list[tuple[int, int, Episode]] = []
         for e in episodes_obj:
             if not isinstance(e, dict):
                 continue
 
-            s_num = (
-                e.get("season_number")
-                or e.get("season")
-                or e.get("season_num")
-                or 0
-            )
-            try:
-                s_num = int(s_num)
-            except Exception:
-                s_num = 0
-            if not s_num:
-                s_num = 1  # default Season 1
-
-            ep_num = (
-                e.get("episode_number")
-                or e.get("episode_num")
-                or e.get("num")
-                or 0
-            )
-            try:
-                ep_num = int(ep_num)
-            except Exception:
-                ep_num = 0
-            if not ep_num:
+            ep = _mk_ep(e)
+            if not ep:
                 continue
 
-            title = (
-                e.get("title")
-                or e.get("name")
-                or e.get("episode_name")
-                or f"Episode {ep_num}"
-            )
-
-            stream_id = e.get("id") or e.get("stream_id")
-            cont = e.get("container_extension") or e.get("container") or "m3u8"
-            direct = e.get("direct_url") or e.get("url") or ""
+            s_num = _to_int(_first(e, "season_number", "season", "season_num"))
+            if not s_num:
+                s_num = 1  # default Season 1
 
-            norm_ep = {
-                "episode_num": ep_num,
-                "title": title,
-                "stream_id": stream_id,
-                "container_extension": cont,
-                "direct_url": direct,
-                "raw": e,
-            }
-            seasons_by_number.setdefault(s_num, []).append(norm_ep)
+            flat.append((s_num, ep.episode_num, ep))
 
-        for s_num, eps in sorted(seasons_by_number.items(), key=lambda x: x[0]):
-            eps_sorted = sorted(eps, key=lambda ep: ep.get("episode_num") or 0)
-            seasons.append({"number": s_num, "episodes": eps_sorted})
+        flat.sort(key=itemgetter(0, 1))
+        for s_num, group in groupby(flat, key=itemgetter(0)):
+            add_season(s_num, [t[2] for t in group])
 
-        return {"seasons": seasons}
+        return seasons, by_season
 
     # --- Case 3: XC-style "seasons" list ---
     seasons_raw = info.get("seasons") or info.get("Seasons") or []
-    norm_seasons = []
     for s in seasons_raw:
         if not isinstance(s, dict):
             continue
-        s_num = s.get("number") or s.get("season_number") or s.get("season", 0)
-        try:
-            s_num = int(s_num)
-        except Exception:
-            s_num = 0
+        s_num = _to_int(_first(s, "number", "season_number", "season"))
         if not s_num:
             continue
 
         eps_raw = s.get("episodes") or s.get("Episodes") or []
-        norm_eps = []
+        norm_eps: list[Episode] = []
         for e in eps_raw:
-            if not isinstance(e, dict):
-                continue
-            ep_num = (
-                e.get("episode_num")
-                or e.get("episode_number")
-                or e.get("num", 0)
-            )
-            try:
-                ep_num = int(ep_num)
-            except Exception:
-                ep_num = 0
-            if not ep_num:
-                continue
-
-            title = (
-                e.get("title")
-                or e.get("name")
-                or e.get("episode_name")
-                or f"Episode {ep_num}"
-            )
-            stream_id = e.get("id") or e.get("stream_id")
-            cont = e.get("container_extension") or e.get("container") or "m3u8"
-            direct = e.get("direct_url") or e.get("url") or ""
-
-            norm_eps.append(
-                {
-                    "episode_num": ep_num,
-                    "title": title,
-                    "stream_id": stream_id,
-                    "container_extension": cont,
-                    "direct_url": direct,
-                    "raw": e,
-                }
-            )
+            if isinstance(e, dict) and (ep := _mk_ep(e, XC_EP_NUM_KEYS)):
+                norm_eps.append(ep)
 
         if norm_eps:
-            norm_seasons.append({"number": s_num, "episodes": norm_eps})
+            add_season(s_num, norm_eps)
 
-    return {"seasons": norm_seasons}
+    return seasons, by_season
 
 
 def get_series_info_xc(server_url: str, xc_user: str, xc_pass: str, series_id: int) -> dict:
@@ -784,15 +1089,16 @@ def get_series_info_xc(server_url: str, xc_user: str, xc_pass: str, series_id: i
         f"&action=get_series_info"
         f"&series_id={series_id}"
     )
-    headers = {"User-Agent": HTTP_USER_AGENT}
     try:
-        r = requests.get(url, timeout=60, headers=headers)
+        r = _SESSION.get(url, timeout=60)
     except requests.RequestException as e:
         log(f"XC get_series_info error for series_id={series_id}: {e}")
         return {"__status_code": 0, "__text": str(e)}
 
     try:
-        data = r.json()
+        # Parse the body bytes directly: avoids r.json()'s extra decoded-text
+        # copy of what can be a very large all-seasons payload.
+        data = json_loads_bytes(r.content)
         if isinstance(data, dict):
             return data
         return {"__status_code": r.status_code, "__data": data}
@@ -800,13 +1106,53 @@ def get_series_info_xc(server_url: str, xc_user: str, xc_pass: str, series_id: i
         return {"__status_code": r.status_code, "__text": r.text}
 
 
+# Opt-in cache for XC series-info (hours; 0 = off, refetch every run).
+# Entries expire because XC series-info changes as new episodes air.
+try:
+    XC_CACHE_TTL_HOURS = float(os.getenv("XC_CACHE_TTL_HOURS") or VARS.get("XC_CACHE_TTL_HOURS", "0"))
+except ValueError:
+    XC_CACHE_TTL_HOURS = 0.0
+
+
+def get_series_info_xc_cached(
+    account_name: str, server_url: str, xc_user: str, xc_pass: str, series_id: int
+) -> dict:
+    """
+    get_series_info_xc() behind an on-disk cache with an mtime TTL, so the
+    fallback doesn't re-download the same series on every run.
+    Only responses carrying "episodes" are cached.
+    """
+    ttl = XC_CACHE_TTL_HOURS * 3600
+    cache_path = (
+        CACHE_BASE_DIR / safe_account_name(account_name) / "xc-series-info" / f"{series_id}.json"
+    )
+    if ttl > 0:
+        try:
+            if time.time() - cache_path.stat().st_mtime < ttl:
+                return json_loads_bytes(cache_path.read_bytes())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log(f"Failed to read XC series-info cache for series_id={series_id} ({account_name}): {e}")
+
+    info = get_series_info_xc(server_url, xc_user, xc_pass, series_id)
+    if ttl > 0 and not DRY_RUN and isinstance(info, dict) and "episodes" in info:
+        try:
+            mkdir(cache_path.parent)
+            write_bytes_atomic(cache_path, json_dumps_bytes(info))
+        except Exception as e:
+            log(f"Failed to write XC series-info cache for series_id={series_id} ({account_name}): {e}")
+    return info
+
+
 def build_provider_info_from_xc(xc_info: dict) -> dict:
     """
-    Convert XC get_series_info output to our normalized provider-info-like structure:
+    Convert XC get_series_info output to our provider-info-like structure:
 
-      { "seasons": [ { "number": N, "episodes": [ ... ] }, ... ] }
+      { "seasons": [ { "number": N, "episodes": [ raw XC ep, ... ] }, ... ] }
 
-    So normalize_provider_info() can work with it.
+    Episodes are passed through as-is; normalize_provider_info_indexed() (case 3)
+    builds the Episode objects in a single pass.
     """
     if not isinstance(xc_info, dict):
         return {}
@@ -820,96 +1166,15 @@ def build_provider_info_from_xc(xc_info: dict) -> dict:
     # Common XC layout: episodes = { "1": [ep...], "2": [ep...] }
     if isinstance(episodes, dict):
         for season_key, ep_list in episodes.items():
-            try:
-                s_num = int(season_key)
-            except Exception:
-                continue
+            s_num = _to_int(season_key)
             if s_num <= 0:
                 continue
-            if not isinstance(ep_list, list):
-                continue
-
-            norm_eps: list[dict] = []
-            for e in ep_list:
-                if not isinstance(e, dict):
-                    continue
-
-                ep_num = (
-                    e.get("episode_num")
-                    or e.get("episode_number")
-                    or e.get("num")
-                    or 0
-                )
-                try:
-                    ep_num = int(ep_num)
-                except Exception:
-                    ep_num = 0
-                if not ep_num:
-                    continue
-
-                title = (
-                    e.get("title")
-                    or e.get("name")
-                    or e.get("episode_name")
-                    or f"Episode {ep_num}"
-                )
-                stream_id = e.get("id") or e.get("stream_id")
-                cont = e.get("container_extension") or e.get("container") or "m3u8"
-                direct = e.get("direct_url") or e.get("url") or ""
-
-                norm_eps.append(
-                    {
-                        "episode_num": ep_num,
-                        "title": title,
-                        "stream_id": stream_id,
-                        "container_extension": cont,
-                        "direct_url": direct,
-                        "raw": e,
-                    }
-                )
-
-            if norm_eps:
-                seasons.append({"number": s_num, "episodes": norm_eps})
+            if isinstance(ep_list, list) and ep_list:
+                seasons.append({"number": s_num, "episodes": ep_list})
 
     # Less common: episodes is a flat list, no seasons
     elif isinstance(episodes, list):
-        norm_eps: list[dict] = []
-        for e in episodes:
-            if not isinstance(e, dict):
-                continue
-            ep_num = (
-                e.get("episode_num")
-                or e.get("episode_number")
-                or e.get("num")
-                or 0
-            )
-            try:
-                ep_num = int(ep_num)
-            except Exception:
-                ep_num = 0
-            if not ep_num:
-                continue
-            title = (
-                e.get("title")
-                or e.get("name")
-                or e.get("episode_name")
-                or f"Episode {ep_num}"
-            )
-            stream_id = e.get("id") or e.get("stream_id")
-            cont = e.get("container_extension") or e.get("container") or "m3u8"
-            direct = e.get("direct_url") or e.get("url") or ""
-            norm_eps.append(
-                {
-                    "episode_num": ep_num,
-                    "title": title,
-                    "stream_id": stream_id,
-                    "container_extension": cont,
-                    "direct_url": direct,
-                    "raw": e,
-                }
-            )
-        if norm_eps:
-            seasons.append({"number": 1, "episodes": norm_eps})
+        seasons.append({"number": 1, "episodes": episodes})
 
     return {"seasons": seasons} if seasons else {}
 
@@ -927,8 +1192,8 @@ def fetch_series_with_fallback(
         provider_info: dict
             Full provider-info-like structure (always includes a "seasons" key
             in the normalized form we use internally).
-        episodes_by_season: dict[int, list[dict]]
-            { season_number: [ episode_dict, ... ], ... }
+        episodes_by_season: dict[int, list[Episode]]
+            { season_number: [ Episode, ... ], ... }
         used_xc_fallback: bool
             True if XC was actually used to populate episodes.
     """
@@ -943,39 +1208,25 @@ def fetch_series_with_fallback(
         or series_id
     )
 
-    def seasons_to_episodes_by_season(norm: dict) -> dict[int, list[dict]]:
-        out: dict[int, list[dict]] = {}
-        for s in norm.get("seasons") or []:
-            s_num = s.get("number") or s.get("season_number") or s.get("season") or 0
-            try:
-                s_num = int(s_num)
-            except Exception:
-                s_num = 0
-            if not s_num:
-                continue
-            eps = s.get("episodes") or []
-            if not isinstance(eps, list):
-                continue
-            out.setdefault(s_num, []).extend(eps)
-        return out
-
     # ------------------------------------------------------------------
     # 1) Primary: Dispatcharr provider-info + normalization
     # ------------------------------------------------------------------
-    provider_raw = provider_info_cached(base, token, account_name, series_id)
+    # Use the prefetched payload if prefetch_provider_info() already ran
+    provider_raw = series.pop("_provider_raw", None)
+    if provider_raw is None:
+        provider_raw = provider_info_cached(base, token, account_name, series_id)
     if not isinstance(provider_raw, dict):
         provider_raw = {}
 
-    provider_norm = normalize_provider_info(provider_raw)
+    seasons, episodes_by_season = normalize_provider_info_indexed(provider_raw)
     # Make sure provider_info always has "seasons" in the normalized form
     provider_info = dict(provider_raw)
-    provider_info["seasons"] = provider_norm.get("seasons", [])
+    provider_info["seasons"] = seasons
 
-    episodes_by_season = seasons_to_episodes_by_season(provider_norm)
     total_eps = sum(len(v) for v in episodes_by_season.values())
 
     if total_eps > 0:
-        if LOG_LEVEL in ("DEBUG", "VERBOSE"):
+        if _VERBOSE:
             log(
                 f"Dispatcharr provider-info episodes for series_id={series_id} "
                 f"({account_name}): {total_eps} episode(s) across "
@@ -1017,7 +1268,7 @@ def fetch_series_with_fallback(
         )
         return provider_info, {}, False
 
-    xc_info = get_series_info_xc(server_url, xc_user, xc_pass, xc_series_id)
+    xc_info = get_series_info_xc_cached(account_name, server_url, xc_user, xc_pass, xc_series_id)
 
     if not isinstance(xc_info, dict) or "episodes" not in xc_info:
         status = xc_info.get("__status_code") if isinstance(xc_info, dict) else None
@@ -1036,8 +1287,7 @@ def fetch_series_with_fallback(
 
     # Convert XC response to our provider-info-like structure and normalize
     provider_from_xc = build_provider_info_from_xc(xc_info)
-    provider_norm_xc = normalize_provider_info(provider_from_xc)
-    episodes_by_season_xc = seasons_to_episodes_by_season(provider_norm_xc)
+    seasons_xc, episodes_by_season_xc = normalize_provider_info_indexed(provider_from_xc)
     total_eps_xc = sum(len(v) for v in episodes_by_season_xc.values())
 
     if total_eps_xc > 0:
@@ -1048,7 +1298,7 @@ def fetch_series_with_fallback(
         )
         # For XC path, we can just treat the XC-normalized structure as provider_info
         provider_info_xc = dict(provider_from_xc)
-        provider_info_xc["seasons"] = provider_norm_xc.get("seasons", [])
+        provider_info_xc["seasons"] = seasons_xc
         return provider_info_xc, episodes_by_season_xc, True
 
     # XC also gave nothing usable – fall back to original (empty) provider-info
@@ -1071,21 +1321,13 @@ def get_normalized_provider_info_with_fallback(
     Internally uses fetch_series_with_fallback(), so if you only care about
     the old behaviour (dict with "seasons"), you can keep calling this.
     """
-    provider_info, episodes_by_season, _ = fetch_series_with_fallback(
+    provider_info, _, _ = fetch_series_with_fallback(
         base=base,
         token=token,
         account=account,
         series=series,
     )
-
-    # Ensure provider_info["seasons"] exists and matches episodes_by_season
-    seasons = provider_info.get("seasons") or []
-    if not seasons and episodes_by_season:
-        seasons = []
-        for s_num, eps in sorted(episodes_by_season.items()):
-            seasons.append({"number": s_num, "episodes": eps})
-        provider_info["seasons"] = seasons
-
+    # fetch_series_with_fallback() always sets the normalized "seasons"
     return provider_info
 
 
@@ -1134,13 +1376,12 @@ def get_movies_cache_path(account_name: str) -> Path:
 
 def load_movies_cache(account_name: str):
     cache_path = get_movies_cache_path(account_name)
-    if not cache_path.exists():
-        return None
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads_bytes(cache_path.read_bytes())
         log(f"Loaded movie cache for '{account_name}' from {cache_path} ({len(data)} movies)")
         return data
+    except FileNotFoundError:
+        return None
     except Exception as e:
         log(f"Failed to read movie cache for '{account_name}': {e}")
         return None
@@ -1152,9 +1393,8 @@ def save_movies_cache(account_name: str, movies: list):
         if DRY_RUN:
             log(f"[dry-run] Would write movie cache for '{account_name}' to {cache_path} ({len(movies)} movies)")
             return
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(movies, f)
+        mkdir(cache_path.parent)
+        write_bytes_atomic(cache_path, json_dumps_bytes(movies))
         log(f"Saved movie cache for '{account_name}' to {cache_path} ({len(movies)} movies)")
     except Exception as e:
         log(f"Failed to write movie cache for '{account_name}': {e}")
@@ -1167,13 +1407,12 @@ def get_series_cache_path(account_name: str) -> Path:
 
 def load_series_cache(account_name: str):
     cache_path = get_series_cache_path(account_name)
-    if not cache_path.exists():
-        return None
     try:
-        with open(cache_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_loads_bytes(cache_path.read_bytes())
         log(f"Loaded series cache for '{account_name}' from {cache_path} ({len(data)} series)")
         return data
+    except FileNotFoundError:
+        return None
     except Exception as e:
         log(f"Failed to read series cache for '{account_name}': {e}")
         return None
@@ -1185,17 +1424,104 @@ def save_series_cache(account_name: str, series_list: list):
         if DRY_RUN:
             log(f"[dry-run] Would write series cache for '{account_name}' to {cache_path} ({len(series_list)} series)")
             return
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, "w", encoding="utf-8") as f:
-            json.dump(series_list, f)
+        mkdir(cache_path.parent)
+        write_bytes_atomic(cache_path, json_dumps_bytes(series_list))
         log(f"Saved series cache for '{account_name}' to {cache_path} ({len(series_list)} series)")
     except Exception as e:
         log(f"Failed to write series cache for '{account_name}': {e}")
 
 
+# Re-runs may skip series whose inputs are unchanged since the last export
+# (opt-in: a skipped series won't restore STRMs deleted by hand).
+SKIP_UNCHANGED_SERIES = (
+    os.getenv("SKIP_UNCHANGED_SERIES") or VARS.get("SKIP_UNCHANGED_SERIES", "false")
+).lower() == "true"
+SERIES_FP_VERSION = 2  # bump when STRM naming/layout or the entry format changes
+
+
+def get_series_fp_path(account_name: str) -> Path:
+    return CACHE_BASE_DIR / safe_account_name(account_name) / "series-fp.json"
+
+
+def load_series_fp(account_name: str) -> dict:
+    """{series_id (str): {"fp": str, "strm": [paths], "written": int}} from the last run."""
+    try:
+        data = json_loads_bytes(get_series_fp_path(account_name).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        log(f"Failed to read series fingerprints for '{account_name}': {e}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_series_fp(account_name: str, store: dict) -> None:
+    cache_path = get_series_fp_path(account_name)
+    try:
+        mkdir(cache_path.parent)
+        write_bytes_atomic(cache_path, json_dumps_bytes(store))
+    except Exception as e:
+        log(f"Failed to write series fingerprints for '{account_name}': {e}")
+
+
+def series_fingerprint(series: dict, provider_raw: dict, context: tuple) -> str:
+    """
+    Hash of everything a series' STRMs depend on: the series record, its
+    raw provider-info and the export settings in `context`.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(json_dumps_bytes([
+        SERIES_FP_VERSION,
+        context,
+        {k: v for k, v in series.items() if not k.startswith("_")},
+        provider_raw,
+    ]))
+    return h.hexdigest()
+
+
 # ------------------------------------------------------------
 # TMDB helpers (JSON + image cache)
 # ------------------------------------------------------------
+class RateLimiter:
+    """
+    Token bucket shared by all worker threads: refills one token every
+    `interval` seconds, holds up to `burst`, and sleeps callers until
+    their token is due. Idle time banks tokens, so a burst after a run of
+    cache hits goes out without waiting.
+    """
+
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self._slack = (burst - 1) * interval  # how far ahead a burst may run
+        self._tat = 0.0  # when the bucket is next completely empty
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            tat = max(now, self._tat)
+            slot = max(now, tat - self._slack)
+            self._tat = tat + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# TMDB also rate-limits with 429, so retry that (honouring Retry-After) too
+TMDB_SESSION = make_session(backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+TMDB_SESSION.headers.pop("Accept", None)  # also used for image downloads
+TMDB_RATE = RateLimiter(TMDB_THROTTLE_SEC, TMDB_BURST)
+# Per-thread flag for TMDB request/download failures (404s excluded), so
+# export_series() can tell "TMDB has no data" from "TMDB wasn't reachable".
+_TMDB_STATE = threading.local()
+
+
+def tmdb_failed() -> bool:
+    """Whether a TMDB call on this thread failed since the last reset."""
+    return getattr(_TMDB_STATE, "failed", False)
+
+
 def tmdb_cache_path(kind: str, key: str) -> Path:
     return CACHE_BASE_DIR / "tmdb" / "json" / kind / f"{key}.json"
 
@@ -1209,43 +1535,70 @@ def tmdb_get_json(url: str, params: dict | None = None) -> dict | None:
         return None
     params = dict(params or {})
     params["api_key"] = TMDB_API_KEY
-    headers = {"User-Agent": HTTP_USER_AGENT}
     try:
-        time.sleep(TMDB_THROTTLE_SEC)
-        r = requests.get(url, params=params, headers=headers, timeout=30)
+        TMDB_RATE.acquire()
+        r = TMDB_SESSION.get(url, params=params, timeout=30)
         if r.status_code != 200:
             log(f"TMDB {url} -> {r.status_code}: {r.text[:200]}")
+            if r.status_code != 404:
+                _TMDB_STATE.failed = True
             return None
         return r.json()
     except requests.RequestException as e:
         log(f"TMDB error {url}: {e}")
+        _TMDB_STATE.failed = True
         return None
 
 
-def tmdb_get_movie(tmdb_id: str) -> dict | None:
-    cache = tmdb_cache_path("movie", tmdb_id)
-    if cache.exists():
-        try:
-            return json.loads(cache.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    url = "https://api.themoviedb.org/3/movie/" + str(tmdb_id)
-    data = tmdb_get_json(url, {"language": NFO_LANG})
-    if data:
+def tmdb_get_cached(
+    kind: str, key: str, url: str, params: dict, require_results: bool = False
+) -> dict | None:
+    """
+    TMDB GET through the on-disk JSON cache. Entries never expire (CLEAR_CACHE
+    resets them), so a warm run makes no TMDB requests for known items.
+    With require_results (searches), responses with no "results" aren't
+    cached, so titles TMDB adds later still get matched on a later run.
+    """
+    cache = tmdb_cache_path(kind, key)
+    try:
+        data = json_loads_bytes(cache.read_bytes())
+        # Older runs cached empty searches too: treat those as misses
+        if not require_results or (isinstance(data, dict) and data.get("results")):
+            return data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log_debug(f"Ignoring unreadable TMDB cache {cache}: {e}")
+    data = tmdb_get_json(url, params)
+    if data and (not require_results or data.get("results")):
         if DRY_RUN:
-            log(f"[dry-run] Would write TMDB movie cache: {cache}")
+            log(f"[dry-run] Would write TMDB {kind} cache: {cache}")
         else:
-            cache.parent.mkdir(parents=True, exist_ok=True)
-            cache.write_text(json.dumps(data), encoding="utf-8")
+            mkdir(cache.parent)
+            write_bytes_atomic(cache, json_dumps_bytes(data))
     return data
 
 
+def tmdb_search_key(title: str, year: int | None) -> str:
+    """Stable cache key for a search query (titles aren't filename-safe)."""
+    return hashlib.sha1(f"{NFO_LANG}|{year or ''}|{title}".encode("utf-8")).hexdigest()
+
+
+def tmdb_get_movie(tmdb_id: str) -> dict | None:
+    url = "https://api.themoviedb.org/3/movie/" + str(tmdb_id)
+    return tmdb_get_cached("movie", str(tmdb_id), url, {"language": NFO_LANG})
+
+
 def tmdb_search_movie(title: str, year: int | None = None) -> dict | None:
     url = "https://api.themoviedb.org/3/search/movie"
     params = {"query": title, "language": NFO_LANG}
     if year:
         params["year"] = year
-    data = tmdb_get_json(url, params)
+    # Matched searches are cached too, so titles without a tmdb_id don't cost
+    # a TMDB round-trip on every run; misses are retried.
+    data = tmdb_get_cached(
+        "search-movie", tmdb_search_key(title, year), url, params, require_results=True
+    )
     if not data:
         return None
     results = data.get("results") or []
@@ -1255,21 +1608,8 @@ def tmdb_search_movie(title: str, year: int | None = None) -> dict | None:
 
 
 def tmdb_get_tv(tmdb_id: str) -> dict | None:
-    cache = tmdb_cache_path("tv", tmdb_id)
-    if cache.exists():
-        try:
-            return json.loads(cache.read_text(encoding="utf-8"))
-        except Exception:
-            pass
     url = "https://api.themoviedb.org/3/tv/" + str(tmdb_id)
-    data = tmdb_get_json(url, {"language": NFO_LANG})
-    if data:
-        if DRY_RUN:
-            log(f"[dry-run] Would write TMDB TV cache: {cache}")
-        else:
-            cache.parent.mkdir(parents=True, exist_ok=True)
-            cache.write_text(json.dumps(data), encoding="utf-8")
-    return data
+    return tmdb_get_cached("tv", str(tmdb_id), url, {"language": NFO_LANG})
 
 
 def tmdb_search_tv(title: str, year: int | None = None) -> dict | None:
@@ -1277,7 +1617,9 @@ def tmdb_search_tv(title: str, year: int | None = None) -> dict | None:
     params = {"query": title, "language": NFO_LANG}
     if year:
         params["first_air_date_year"] = year
-    data = tmdb_get_json(url, params)
+    data = tmdb_get_cached(
+        "search-tv", tmdb_search_key(title, year), url, params, require_results=True
+    )
     if not data:
         return None
     results = data.get("results") or []
@@ -1286,23 +1628,10 @@ def tmdb_search_tv(title: str, year: int | None = None) -> dict | None:
     return results[0]
 
 
-def tmdb_get_tv_episode(tv_tmdb_id: str, season: int, episode: int) -> dict | None:
-    key = f"{tv_tmdb_id}-{season}-{episode}"
-    cache = tmdb_cache_path("episode", key)
-    if cache.exists():
-        try:
-            return json.loads(cache.read_text(encoding="utf-8"))
-        except Exception:
-            pass
-    url = f"https://api.themoviedb.org/3/tv/{tv_tmdb_id}/season/{season}/episode/{episode}"
-    data = tmdb_get_json(url, {"language": NFO_LANG})
-    if data:
-        if DRY_RUN:
-            log(f"[dry-run] Would write TMDB episode cache: {cache}")
-        else:
-            cache.parent.mkdir(parents=True, exist_ok=True)
-            cache.write_text(json.dumps(data), encoding="utf-8")
-    return data
+def tmdb_get_tv_season(tv_tmdb_id: str, season: int) -> dict | None:
+    """Whole season in one call (includes every episode's overview/air_date/id)."""
+    url = f"https://api.themoviedb.org/3/tv/{tv_tmdb_id}/season/{season}"
+    return tmdb_get_cached("season", f"{tv_tmdb_id}-{season}", url, {"language": NFO_LANG})
 
 
 def tmdb_download_image(path_fragment: str, size: str, dest_path: Path) -> bool:
@@ -1315,42 +1644,67 @@ def tmdb_download_image(path_fragment: str, size: str, dest_path: Path) -> bool:
     cache_file = tmdb_img_cache_path(f"{size}{path_fragment}")
     if cache_file.exists():
         mkdir(dest_path.parent)
-        shutil.copy2(cache_file, dest_path)
+        link_or_copy(cache_file, dest_path)
         return True
     base = "https://image.tmdb.org/t/p"
     url = f"{base}/{size}{path_fragment}"
+    # Stream to a per-thread temp file so a parallel exporter never
+    # copies a half-written image out of the cache.
+    tmp = f"{cache_file}.{threading.get_ident()}.tmp"
     try:
-        time.sleep(TMDB_THROTTLE_SEC)
-        r = requests.get(url, timeout=30, stream=True)
-        if r.status_code == 200:
-            cache_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, "wb") as f:
-                for chunk in r.iter_content(8192):
-                    f.write(chunk)
-            mkdir(dest_path.parent)
-            shutil.copy2(cache_file, dest_path)
-            return True
-        else:
-            log(f"TMDB image {url} -> {r.status_code}")
-    except requests.RequestException as e:
+        TMDB_RATE.acquire()
+        with TMDB_SESSION.get(url, timeout=30, stream=True) as r:
+            if r.status_code != 200:
+                log(f"TMDB image {url} -> {r.status_code}")
+                if r.status_code != 404:
+                    _TMDB_STATE.failed = True
+                return False
+            mkdir(cache_file.parent)
+            r.raw.decode_content = True
+            with open(tmp, "wb") as f:
+                shutil.copyfileobj(r.raw, f, 1 << 20)
+        os.replace(tmp, cache_file)
+    except (requests.RequestException, Urllib3HTTPError, OSError) as e:
         log(f"TMDB image error {url}: {e}")
-    return False
+        _TMDB_STATE.failed = True
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
+    mkdir(dest_path.parent)
+    link_or_copy(cache_file, dest_path)
+    return True
 
 
 # ------------------------------------------------------------
 # NFO generation helpers
 # ------------------------------------------------------------
+XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_XML_ESCAPE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&apos;",
+})
+
+
 def escape_xml(text: str) -> str:
     if text is None:
         return ""
-    return (
-        str(text)
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
+    return str(text).translate(_XML_ESCAPE)
+
+
+def _xml_ids(imdb_id, tmdb_id) -> str:
+    """Shared <id>/<imdbid>/<tmdbid> tail of all three NFO kinds."""
+    out = ""
+    if imdb_id:
+        imdb = escape_xml(imdb_id)
+        out = f"  <id>{imdb}</id>\n  <imdbid>{imdb}</imdbid>\n"
+    if tmdb_id:
+        out += f"  <tmdbid>{escape_xml(tmdb_id)}</tmdbid>\n"
+    return out
 
 
 def build_movie_nfo(movie: dict, tmdb_data: dict | None = None, imdb_id: str | None = None) -> str:
@@ -1370,21 +1724,15 @@ def build_movie_nfo(movie: dict, tmdb_data: dict | None = None, imdb_id: str | N
             if d and len(d) >= 4:
                 year = d[:4]
 
-    lines = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>', "<movie>"]
-    lines.append(f"  <title>{escape_xml(title)}</title>")
-    if year:
-        lines.append(f"  <year>{escape_xml(year)}</year>")
-    if plot:
-        lines.append(f"  <plot>{escape_xml(plot)}</plot>")
-    if rating:
-        lines.append(f"  <rating>{escape_xml(rating)}</rating>")
-    if imdb_id:
-        lines.append(f"  <id>{escape_xml(imdb_id)}</id>")
-        lines.append(f"  <imdbid>{escape_xml(imdb_id)}</imdbid>")
-    if tmdb_id:
-        lines.append(f"  <tmdbid>{escape_xml(tmdb_id)}</tmdbid>")
-    lines.append("</movie>")
-    return "\n".join(lines) + "\n"
+    return (
+        f"{XML_HEADER}<movie>\n"
+        f"  <title>{escape_xml(title)}</title>\n"
+        + (f"  <year>{escape_xml(year)}</year>\n" if year else "")
+        + (f"  <plot>{escape_xml(plot)}</plot>\n" if plot else "")
+        + (f"  <rating>{escape_xml(rating)}</rating>\n" if rating else "")
+        + _xml_ids(imdb_id, tmdb_id)
+        + "</movie>\n"
+    )
 
 
 def build_tvshow_nfo(series: dict, tmdb_data: dict | None = None) -> str:
@@ -1402,30 +1750,25 @@ def build_tvshow_nfo(series: dict, tmdb_data: dict | None = None) -> str:
             if first and len(first) >= 4:
                 year = first[:4]
 
-    lines = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>', "<tvshow>"]
-    lines.append(f"  <title>{escape_xml(title)}</title>")
-    if year:
-        lines.append(f"  <year>{escape_xml(year)}</year>")
-    if plot:
-        lines.append(f"  <plot>{escape_xml(plot)}</plot>")
-    if imdb_id:
-        lines.append(f"  <id>{escape_xml(imdb_id)}</id>")
-        lines.append(f"  <imdbid>{escape_xml(imdb_id)}</imdbid>")
-    if tmdb_id:
-        lines.append(f"  <tmdbid>{escape_xml(tmdb_id)}</tmdbid>")
-    lines.append("</tvshow>")
-    return "\n".join(lines) + "\n"
+    return (
+        f"{XML_HEADER}<tvshow>\n"
+        f"  <title>{escape_xml(title)}</title>\n"
+        + (f"  <year>{escape_xml(year)}</year>\n" if year else "")
+        + (f"  <plot>{escape_xml(plot)}</plot>\n" if plot else "")
+        + _xml_ids(imdb_id, tmdb_id)
+        + "</tvshow>\n"
+    )
 
 
 def build_episode_nfo(
     series: dict,
     season_num: int,
     episode_num: int,
-    ep: dict,
+    ep: Episode,
     tmdb_tv: dict | None = None,
     tmdb_ep: dict | None = None,
 ) -> str:
-    title = ep.get("title") or ep.get("name") or f"Episode {episode_num}"
+    title = ep.title or f"Episode {episode_num}"
     plot = ""
     air_date = ""
     imdb_id = None
@@ -1441,29 +1784,33 @@ def build_episode_nfo(
         imdb_id = tmdb_tv.get("imdb_id")
         tmdb_id = tmdb_tv.get("id")
 
-    lines = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>', "<episodedetails>"]
-    lines.append(f"  <title>{escape_xml(title)}</title>")
-    if show_title:
-        lines.append(f"  <showtitle>{escape_xml(show_title)}</showtitle>")
-    lines.append(f"  <season>{season_num}</season>")
-    lines.append(f"  <episode>{episode_num}</episode>")
-    if plot:
-        lines.append(f"  <plot>{escape_xml(plot)}</plot>")
-    if air_date:
-        lines.append(f"  <aired>{escape_xml(air_date)}</aired>")
-    if imdb_id:
-        lines.append(f"  <id>{escape_xml(imdb_id)}</id>")
-        lines.append(f"  <imdbid>{escape_xml(imdb_id)}</imdbid>")
-    if tmdb_id:
-        lines.append(f"  <tmdbid>{escape_xml(tmdb_id)}</tmdbid>")
-    lines.append("</episodedetails>")
-    return "\n".join(lines) + "\n"
+    return (
+        f"{XML_HEADER}<episodedetails>\n"
+        f"  <title>{escape_xml(title)}</title>\n"
+        + (f"  <showtitle>{escape_xml(show_title)}</showtitle>\n" if show_title else "")
+        + f"  <season>{season_num}</season>\n"
+        f"  <episode>{episode_num}</episode>\n"
+        + (f"  <plot>{escape_xml(plot)}</plot>\n" if plot else "")
+        + (f"  <aired>{escape_xml(air_date)}</aired>\n" if air_date else "")
+        + _xml_ids(imdb_id, tmdb_id)
+        + "</episodedetails>\n"
+    )
 
 
 # ------------------------------------------------------------
 # Per-movie / per-series export
 # ------------------------------------------------------------
-def export_movie(account_name: str, movies_dir: Path, proxy_host: str, account_id: int, movie: dict):
+def movie_title_fs(movie: dict) -> str:
+    """Folder/file stem for a movie: 'Clean Title (Year)' made filesystem-safe."""
+    clean_title = normalize_title(movie.get("name") or "")
+    year = movie.get("year") or 0
+    return fs_safe(f"{clean_title} ({year})") if year else fs_safe(clean_title)
+
+
+def export_movie(
+    account_name: str, movies_dir: Path, proxy_host: str, account_id: int, movie: dict
+) -> tuple[str, str]:
+    """Write STRM (+ NFO/artwork) for one movie; returns (STRM path, write_strm() status)."""
     name = movie.get("name") or ""
     year = movie.get("year") or 0
     tmdb_id = movie.get("tmdb_id")
@@ -1476,23 +1823,28 @@ def export_movie(account_name: str, movies_dir: Path, proxy_host: str, account_i
     if not cat:
         cat = "Unsorted"
     cat = fs_safe(cat)
-    title_fs = fs_safe(f"{clean_title} ({year})") if year else fs_safe(clean_title)
+    title_fs = movie_title_fs(movie)
 
     #movie_dir = movies_dir / cat / title_fs
-    movie_dir = movies_dir / title_fs
-    strm_path = movie_dir / (title_fs + ".strm")
+    # Plain string join: fs_safe() names never contain a separator
+    strm_path = os.path.join(movies_dir, title_fs, title_fs + ".strm")
 
     vod_uuid = movie.get("uuid") or ""
     url = build_movie_proxy_url(proxy_host, account_id, vod_uuid)
-    write_strm(strm_path, url)
+    status = write_strm(strm_path, url)
 
     if not ENABLE_NFO:
-        return
+        return strm_path, status
 
+    movie_dir = movies_dir / title_fs
     movie_nfo_path = movie_dir / "movie.nfo"
     poster_path = movie_dir / "poster.jpg"
     fanart_path = movie_dir / "fanart.jpg"
 
+    # Already fully exported: TMDB data would only feed files we keep as-is
+    if not OVERWRITE_NFO and movie_nfo_path.exists() and poster_path.exists() and fanart_path.exists():
+        return strm_path, status
+
     tmdb_data = None
     if tmdb_id:
         tmdb_data = tmdb_get_movie(tmdb_id)
@@ -1521,6 +1873,8 @@ def export_movie(account_name: str, movies_dir: Path, proxy_host: str, account_i
         if back_frag:
             tmdb_download_image(back_frag, "w780", fanart_path)
 
+    return strm_path, status
+
 
 def export_series(
     base: str,
@@ -1530,7 +1884,13 @@ def export_series(
     proxy_host: str,
     account_id: int,
     series: dict,
-):
+) -> tuple[list[str], int, int, int, bool]:
+    """
+    Write STRMs (+ NFO/artwork) for one series. Returns the expected STRM
+    paths (as str, for stale cleanup), how many were added / updated / left
+    unchanged, and whether every TMDB lookup/download it tried succeeded.
+    """
+    _TMDB_STATE.failed = False
     account_name = account.get("name") or f"Account-{account_id}"
     name = series.get("name") or ""
     year = series.get("year") or 0
@@ -1558,25 +1918,24 @@ def export_series(
         series=series,
     )
 
-    # Ensure provider_info has a "seasons" list built from episodes_by_season
-    seasons = provider_info.get("seasons") or []
-    if not seasons and episodes_by_season:
-        seasons = []
-        for s_num, eps in sorted(episodes_by_season.items()):
-            seasons.append({"number": s_num, "episodes": eps})
-        provider_info["seasons"] = seasons
+    # Normalized seasons, built in the same pass as episodes_by_season
+    seasons = provider_info["seasons"]
 
-    if used_xc and LOG_LEVEL in ("DEBUG", "VERBOSE"):
+    if used_xc and _VERBOSE:
         total_eps = sum(len(v) for v in episodes_by_season.values())
         log(
             f"Series '{name}' ({account_name}) used XC fallback: "
             f"{total_eps} episode(s) across {len(episodes_by_season)} season(s)."
         )
 
-    series["_provider_info"] = provider_info
-
+    # TMDB show lookup is deferred until some file actually needs it, so
+    # incremental runs over fully exported shows make no TMDB calls.
     tv_tmdb_data = None
-    if ENABLE_NFO:
+    tmdb_resolved = False
+
+    def resolve_tmdb() -> None:
+        nonlocal tmdb_id, tv_tmdb_data, tmdb_resolved
+        tmdb_resolved = True
         if tmdb_id:
             tv_tmdb_data = tmdb_get_tv(tmdb_id)
         else:
@@ -1586,60 +1945,174 @@ def export_series(
                 series["tmdb_id"] = tmdb_id
                 tv_tmdb_data = tmdb_get_tv(tmdb_id) if tmdb_id else None
 
+    if ENABLE_NFO:
         tvshow_nfo_path = show_dir / "tvshow.nfo"
-        if OVERWRITE_NFO or not tvshow_nfo_path.exists():
-            xml = build_tvshow_nfo(series, tv_tmdb_data)
-            write_text_atomic(tvshow_nfo_path, xml)
-
-        if tv_tmdb_data:
-            poster_frag = tv_tmdb_data.get("poster_path")
-            back_frag = tv_tmdb_data.get("backdrop_path")
-            poster_path = show_dir / "poster.jpg"
-            fanart_path = show_dir / "fanart.jpg"
-            if poster_frag:
-                tmdb_download_image(poster_frag, "w500", poster_path)
-            if back_frag:
-                tmdb_download_image(back_frag, "w780", fanart_path)
-
+        poster_path = show_dir / "poster.jpg"
+        fanart_path = show_dir / "fanart.jpg"
+        if OVERWRITE_NFO or not (
+            tvshow_nfo_path.exists() and poster_path.exists() and fanart_path.exists()
+        ):
+            resolve_tmdb()
+
+            if OVERWRITE_NFO or not tvshow_nfo_path.exists():
+                xml = build_tvshow_nfo(series, tv_tmdb_data)
+                write_text_atomic(tvshow_nfo_path, xml)
+
+            if tv_tmdb_data:
+                poster_frag = tv_tmdb_data.get("poster_path")
+                back_frag = tv_tmdb_data.get("backdrop_path")
+                if poster_frag:
+                    tmdb_download_image(poster_frag, "w500", poster_path)
+                if back_frag:
+                    tmdb_download_image(back_frag, "w780", fanart_path)
+
+    strm_paths: list[str] = []
+    added = updated = unchanged = 0
+    vod_uuid = series.get("uuid") or ""
     for s in seasons:
         s_num = s.get("number") or 0
         if not s_num:
             continue
-        season_dir = show_dir / f"Season {s_num:02d}"
+        season_dir = os.path.join(show_dir, f"Season {s_num:02d}")
         mkdir(season_dir)
+        code_prefix = f"S{s_num:02d}E"
         episodes = s.get("episodes") or []
+        tmdb_eps = None  # episode_number -> TMDB episode, fetched once per season on demand
         for ep in episodes:
-            ep_num = ep.get("episode_num") or 0
+            ep_num = ep.episode_num
             if not ep_num:
                 continue
-            ep_title = ep.get("title") or f"Episode {ep_num}"
+            ep_title = ep.title or f"Episode {ep_num}"
             ep_title_clean = normalize_title(ep_title)
-            filename = f"S{s_num:02d}E{ep_num:02d} - {ep_title_clean}".strip(" -")
-            strm_path = season_dir / f"{filename}.strm"
+            filename = f"{code_prefix}{ep_num:02d} - {ep_title_clean}".strip(" -")
+            strm_path = join_path(season_dir, f"{filename}.strm")
+            strm_paths.append(strm_path)
 
-            vod_uuid = series.get("uuid") or ""
-            stream_id = ep.get("stream_id")
+            stream_id = ep.stream_id
             if vod_uuid:
                 url = build_series_episode_proxy_url(proxy_host, account_id, vod_uuid, s_num, ep_num)
             elif stream_id:
                 url = build_series_episode_streamid_proxy_url(proxy_host, account_id, stream_id)
             else:
                 continue
-            write_strm(strm_path, url)
+            status = write_strm(strm_path, url)
+            if status == "added":
+                added += 1
+            elif status == "updated":
+                updated += 1
+            else:
+                unchanged += 1
 
             if ENABLE_NFO:
-                ep_nfo_path = season_dir / f"{filename}.nfo"
-                if OVERWRITE_NFO or not ep_nfo_path.exists():
+                ep_nfo_path = join_path(season_dir, f"{filename}.nfo")
+                if OVERWRITE_NFO or not os.path.exists(ep_nfo_path):
+                    if not tmdb_resolved:
+                        resolve_tmdb()
                     tmdb_ep = None
                     if tmdb_id:
-                        tmdb_ep = tmdb_get_tv_episode(tmdb_id, s_num, ep_num)
+                        if tmdb_eps is None:
+                            season_data = tmdb_get_tv_season(tmdb_id, s_num) or {}
+                            tmdb_eps = {
+                                e.get("episode_number"): e
+                                for e in season_data.get("episodes") or []
+                                if isinstance(e, dict)
+                            }
+                        tmdb_ep = tmdb_eps.get(ep_num)
                     xml = build_episode_nfo(series, s_num, ep_num, ep, tv_tmdb_data, tmdb_ep)
                     write_text_atomic(ep_nfo_path, xml)
 
+    return strm_paths, added, updated, unchanged, not tmdb_failed()
+
 
 # ------------------------------------------------------------
 # Export loops for movies/series per account
 # ------------------------------------------------------------
+# Titles exported concurrently (TMDB lookups + artwork are network bound).
+# Items that map to the same folder always share one worker, in list order.
+try:
+    EXPORT_WORKERS = max(1, int(os.getenv("EXPORT_WORKERS") or VARS.get("EXPORT_WORKERS", "16")))
+except ValueError:
+    EXPORT_WORKERS = 16
+# Accounts exported concurrently (each writes its own tree). Every account
+# brings its own EXPORT_WORKERS/PROVIDER_INFO_WORKERS pools, and log lines
+# of parallel accounts interleave, hence the serial default.
+try:
+    ACCOUNT_WORKERS = max(1, int(os.getenv("ACCOUNT_WORKERS") or VARS.get("ACCOUNT_WORKERS", "1")))
+except ValueError:
+    ACCOUNT_WORKERS = 1
+
+
+def _unlink_quiet(path: str) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except OSError:
+        return False
+
+
+def remove_stale_strm(
+    root: Path, expected_files: set[str], kind: str, skip_dirs: set[str] | None = None
+) -> int:
+    """
+    Single os.walk over root: delete .strm files not in expected_files
+    (string paths), then prune directories left empty. Subtrees listed in
+    skip_dirs are known to be clean and aren't descended into.
+    Returns the number of stale .strm files removed.
+
+    Unlinks run on a thread pool (each is a round trip on NFS/SMB shares)
+    and rmdir is only attempted on directories the walk shows will be
+    empty, leaves first.
+    """
+    item = "movie" if kind == "movies" else kind
+    root_str = str(root)
+    stale: list[str] = []
+    empty_dirs: list[str] = []
+    emptied: set[str] = set()
+
+    # Top-down so skipped subtrees can be pruned; reversed pre-order then
+    # visits every directory after all of its descendants.
+    walked = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        walked.append((dirpath, list(dirnames), filenames))  # unpruned: skipped dirs stay
+        if skip_dirs:
+            dirnames[:] = [d for d in dirnames if os.path.join(dirpath, d) not in skip_dirs]
+
+    for dirpath, dirnames, filenames in reversed(walked):
+        kept = False
+        for fn in filenames:
+            if not fn.endswith(".strm"):
+                kept = True
+                continue
+            path = os.path.join(dirpath, fn)
+            if path in expected_files:
+                kept = True
+                continue
+            if DRY_RUN:
+                log(f"[dry-run] Would delete stale {item} STRM: {path}")
+            stale.append(path)
+        if dirpath == root_str:
+            continue
+        if DRY_RUN:
+            log(f"[dry-run] Would remove empty directory ({kind}): {dirpath}")
+            continue
+        if not kept and all(os.path.join(dirpath, d) in emptied for d in dirnames):
+            emptied.add(dirpath)
+            empty_dirs.append(dirpath)
+
+    if DRY_RUN:
+        return len(stale)
+
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as ex:
+        removed = sum(ex.map(_unlink_quiet, stale))
+    for dirpath in empty_dirs:
+        try:
+            os.rmdir(dirpath)
+            _CREATED_DIRS.discard(dirpath)
+        except OSError:
+            pass
+    return removed
+
+
 def export_movies_for_account(base: str, token: str, account: dict):
     if not EXPORT_MOVIES:
         log("EXPORT_MOVIES=false: skipping movies export")
@@ -1676,65 +2149,69 @@ def export_movies_for_account(base: str, token: str, account: dict):
 
     added = 0
     updated = 0
+    unchanged = 0
+    removed = 0
     written = 0
-    expected_files: set[Path] = set()
+    expected_files: set[str] = set()
+
+    # Group by target folder so duplicates are still written in list order
+    # (last one wins) while distinct titles export in parallel.
+    groups: dict[str, list[dict]] = {}
+    for movie in movies:
+        groups.setdefault(movie_title_fs(movie), []).append(movie)
+
+    def export_group(group: list[dict]) -> tuple[int, str, int, int, int]:
+        n_added = n_updated = n_unchanged = 0
+        for movie in group:
+            strm_path, status = export_movie(account_name, movies_dir, proxy_host, account_id, movie)
+            if status == "added":
+                n_added += 1
+            elif status == "updated":
+                n_updated += 1
+            else:
+                n_unchanged += 1
+        return len(group), strm_path, n_added, n_updated, n_unchanged
 
     total_movies = len(movies) or None
     processed = 0
     next_progress_pct = 10
 
-    for movie in movies:
-        processed += 1
-        export_movie(account_name, movies_dir, proxy_host, account_id, movie)
-        name = movie.get("name") or ""
-        year = movie.get("year") or 0
-        clean_title = movie.get("clean_title") or normalize_title(name)
-        cat = fs_safe(movie.get("genre") or "Unsorted")
-        title_fs = fs_safe(f"{clean_title} ({year})") if year else fs_safe(clean_title)
-        #movie_dir = movies_dir / cat / title_fs
-        movie_dir = movies_dir / title_fs
-        strm_path = movie_dir / (title_fs + ".strm")
-        expected_files.add(strm_path)
-        written += 1
-        added += 1
-
-        if total_movies:
-            pct = (processed * 100) // total_movies
-            # Show at 10% steps plus first and last
-            if (
-                processed == 1
-                or processed == total_movies
-                or pct >= next_progress_pct
-            ):
-                log_progress(
-                    f"Movies export '{account_name}' (API) progress: {pct}% "
-                    f"({processed}/{total_movies} movies processed, {written} .strm written)"
-                )
-                while next_progress_pct <= pct and next_progress_pct < 100:
-                    next_progress_pct += 10
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as ex:
+        futures = [ex.submit(export_group, g) for g in groups.values()]
+        for fut in as_completed(futures):
+            n, strm_path, n_added, n_updated, n_unchanged = fut.result()
+            expected_files.add(strm_path)
+            first = processed == 0
+            processed += n
+            written += n_added + n_updated
+            added += n_added
+            updated += n_updated
+            unchanged += n_unchanged
+
+            if total_movies:
+                pct = (processed * 100) // total_movies
+                # Show at 10% steps plus first and last
+                if (
+                    first
+                    or processed == total_movies
+                    or pct >= next_progress_pct
+                ):
+                    log_progress(
+                        f"Movies export '{account_name}' (API) progress: {pct}% "
+                        f"({processed}/{total_movies} movies processed, {written} .strm written)"
+                    )
+                    while next_progress_pct <= pct and next_progress_pct < 100:
+                        next_progress_pct += 10
 
     if DELETE_OLD and movies_dir.exists():
-        removed = 0
-        for existing in movies_dir.glob("**/*.strm"):
-            if existing not in expected_files:
-                if DRY_RUN:
-                    log(f"[dry-run] Would delete stale movie STRM: {existing}")
-                else:
-                    existing.unlink()
-                removed += 1
+        removed = remove_stale_strm(movies_dir, expected_files, "movies")
         log(f"Movies cleanup for '{account_name}': removed {removed} stale .strm files.")
-        dirs = [p for p in movies_dir.glob("**/*") if p.is_dir()]
-        for d in sorted(dirs, key=lambda p: len(p.as_posix()), reverse=True):
-            if DRY_RUN:
-                log(f"[dry-run] Would remove empty directory (movies): {d}")
-                continue
-            try:
-                d.rmdir()
-            except OSError:
-                pass
 
     active = len(expected_files)
-    log(f"Movies export summary for '{account_name}': {added} added, {updated} updated, {0} removed, {active} active.")
+    log(
+        f"Movies export summary for '{account_name}': {added} added, {updated} updated, "
+        f"{unchanged} unchanged, {removed} removed, {active} active."
+    )
 
 
 def export_series_for_account(base: str, token: str, account: dict):
@@ -1773,90 +2250,161 @@ def export_series_for_account(base: str, token: str, account: dict):
 
     added_eps = 0
     updated_eps = 0
+    unchanged_eps = 0
     removed_eps = 0
-    expected_files: set[Path] = set()
+    expected_files: set[str] = set()
+
+    use_fp = SKIP_UNCHANGED_SERIES and not OVERWRITE_NFO and not DRY_RUN
+    fp_old = load_series_fp(account_name) if use_fp else {}
+    fp_new: dict = {}
+    # DELETE_OLD is included so that skipped show folders (which the cleanup
+    # walk prunes) were always cleaned up by the run that fingerprinted them.
+    fp_context = (
+        str(series_dir), proxy_host, account_id, ENABLE_NFO, bool(TMDB_API_KEY), NFO_LANG,
+        DELETE_OLD,
+    )
+
+    def unchanged(s: dict) -> tuple[str | None, dict | None]:
+        """(fingerprint, previous entry if it still matches and its dirs exist)."""
+        raw = s.get("_provider_raw")
+        # Only Dispatcharr-sourced episodes: the XC fallback isn't in raw
+        if not (use_fp and isinstance(raw, dict) and raw.get("episodes")):
+            return None, None
+        fp = series_fingerprint(s, raw, fp_context)
+        prev = fp_old.get(str(s.get("id")))
+        if not prev or prev.get("fp") != fp:
+            return fp, None
+        season_dirs = {os.path.dirname(p) for p in prev.get("strm") or []}
+        if not all(os.path.isdir(d) for d in season_dirs):
+            return fp, None
+        return fp, prev
+
+    clean_show_dirs: set[str] = set()  # fully skipped: cleanup needn't walk them
+
+    def export_group(show_fs: str, group: list[dict]) -> tuple[int, list[str], int, int, int]:
+        strm_paths: list[str] = []
+        n_added = n_updated = n_unchanged = 0
+        # Series in a group share the show folder (last write wins), so
+        # skip only when the whole group is unchanged.
+        decisions = [unchanged(s) for s in group]
+        if all(prev for _, prev in decisions):
+            clean_show_dirs.add(os.path.join(series_dir, show_fs))
+        else:
+            decisions = [(fp, None) for fp, _ in decisions]
+        for s, (fp, prev) in zip(group, decisions):
+            sid = str(s.get("id"))
+            if prev:
+                s.pop("_provider_raw", None)
+                fp_new[sid] = prev
+                strm_paths += prev["strm"]
+                n_unchanged += prev.get("written", 0)
+                continue
+
+            # Write STRMs + NFO + artwork for this series (with XC fallback)
+            paths, a, u, same, tmdb_ok = export_series(
+                base, token, account, series_dir, proxy_host, account_id, s
+            )
+            strm_paths += paths
+            n_added += a
+            n_updated += u
+            n_unchanged += same
+            # After a TMDB/download failure, leave it unfingerprinted so the
+            # next run retries the missing NFO data/artwork.
+            if fp and tmdb_ok:
+                # "strm" also lists URL-less paths (kept for cleanup), so the
+                # number actually written is stored on its own.
+                fp_new[sid] = {"fp": fp, "strm": paths, "written": a + u + same}
+        return len(group), strm_paths, n_added, n_updated, n_unchanged
+
+    # Series sharing a show folder run in list order on one worker
+    groups: dict[str, list[dict]] = {}
+    for s in series_list:
+        groups.setdefault(fs_safe(normalize_title(s.get("name") or "")), []).append(s)
 
     total_series = len(series_list) or None
     processed_series = 0
     next_progress_pct = 10
 
-    for s in series_list:
-        processed_series += 1
+    def collect(fut) -> None:
+        nonlocal processed_series, added_eps, updated_eps, unchanged_eps, next_progress_pct
+        n, strm_paths, n_added, n_updated, n_unchanged = fut.result()
+        first = processed_series == 0
+        processed_series += n
+        expected_files.update(strm_paths)
+        added_eps += n_added
+        updated_eps += n_updated
+        unchanged_eps += n_unchanged
 
         # 10% step progress logging for series provider-info + STRM
         if total_series:
             pct = (processed_series * 100) // total_series
             if (
-                processed_series == 1
+                first
                 or processed_series == total_series
                 or pct >= next_progress_pct
             ):
                 log_progress(
                     f"Series export '{account_name}' progress: {pct}% "
                     f"({processed_series}/{total_series} series processed, "
-                    f"{added_eps} episodes written so far)"
+                    f"{added_eps + updated_eps} episodes written so far)"
                 )
                 while next_progress_pct <= pct and next_progress_pct < 100:
                     next_progress_pct += 10
 
-        # Write STRMs + NFO + artwork for this series (with XC fallback)
-        export_series(base, token, account, series_dir, proxy_host, account_id, s)
-
-        # Now recompute expected STRM paths for cleanup
-        name = s.get("name") or ""
-        clean_title = normalize_title(name)
-        cat = fs_safe(s.get("genre") or "Unsorted")
-        show_fs = fs_safe(clean_title)
-        #show_dir = series_dir / cat / show_fs
-        show_dir = series_dir / show_fs
-
-        provider = s.get("_provider_info")
-        if not provider:
-            series_id = s.get("id")
-            provider_raw = provider_info_cached(base, token, account_name, series_id)
-            provider = normalize_provider_info(provider_raw)
-        seasons = (provider or {}).get("seasons", [])
-
-        for season in seasons:
-            s_num = season.get("number") or 0
-            if not s_num:
-                continue
-            season_dir = show_dir / f"Season {s_num:02d}"
-            episodes = season.get("episodes") or []
-            for ep in episodes:
-                ep_num = ep.get("episode_num") or 0
-                if not ep_num:
-                    continue
-                ep_title = ep.get("title") or f"Episode {ep_num}"
-                ep_title_clean = normalize_title(ep_title)
-                filename = f"S{s_num:02d}E{ep_num:02d} - {ep_title_clean}".strip(" -")
-                strm_path = season_dir / f"{filename}.strm"
-                expected_files.add(strm_path)
-                added_eps += 1
+    # Windows of whole groups (a group's skip decision needs all its payloads)
+    windows: list[list[tuple[str, list[dict]]]] = [[]]
+    window_size = 0
+    for item in groups.items():
+        if window_size >= PROVIDER_INFO_WINDOW:
+            windows.append([])
+            window_size = 0
+        windows[-1].append(item)
+        window_size += len(item[1])
+
+    listing = list_provider_info_cache(account_name) if series_list else {}
+    prefetched = 0
+    prefetch_secs = 0.0
+    pending: dict = {}  # future -> series in its group
+
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as ex:
+        for window in windows:
+            # Fetch this window while the previous one is still exporting
+            t0 = time.time()
+            prefetched += prefetch_provider_info(
+                base, token, account_name, [s for _, g in window for s in g], listing
+            )
+            prefetch_secs += time.time() - t0
+
+            # Backpressure: at most about one window in flight before the next
+            # is fetched, which bounds the raw payloads held in memory.
+            while sum(pending.values()) > PROVIDER_INFO_WINDOW:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    del pending[fut]
+                    collect(fut)
+            for k, g in window:
+                pending[ex.submit(export_group, k, g)] = len(g)
+
+        for fut in as_completed(pending):
+            collect(fut)
+
+    if series_list:
+        log(
+            f"Prefetched provider-info for {prefetched}/{len(series_list)} series "
+            f"('{account_name}') in {prefetch_secs:.1f}s using {PROVIDER_INFO_WORKERS} workers"
+        )
+
+    if use_fp:
+        save_series_fp(account_name, fp_new)
 
     if DELETE_OLD and series_dir.exists():
-        for existing in series_dir.glob("**/*.strm"):
-            if existing not in expected_files:
-                if DRY_RUN:
-                    log(f"[dry-run] Would delete stale series STRM: {existing}")
-                else:
-                    existing.unlink()
-                removed_eps += 1
+        removed_eps = remove_stale_strm(series_dir, expected_files, "series", clean_show_dirs)
         log(f"Series cleanup for '{account_name}': removed {removed_eps} stale .strm files.")
-        dirs = [p for p in series_dir.glob("**/*") if p.is_dir()]
-        for d in sorted(dirs, key=lambda p: len(p.as_posix()), reverse=True):
-            if DRY_RUN:
-                log(f"[dry-run] Would remove empty directory (series): {d}")
-                continue
-            try:
-                d.rmdir()
-            except OSError:
-                pass
 
     active_eps = len(expected_files)
     log(
         f"Series export summary for '{account_name}': {added_eps} added, {updated_eps} updated, "
-        f"{removed_eps} removed, {active_eps} active."
+        f"{unchanged_eps} unchanged, {removed_eps} removed, {active_eps} active."
     )
 
 
@@ -1897,38 +2445,60 @@ if __name__ == "__main__":
             raise SystemExit(1)
 
         log(f"Found {len(filtered_accounts)} M3U/XC account(s) matching patterns: {XC_PATTERNS}")
-        for acc in filtered_accounts:
-            account_name = acc.get("name") or f"Account-{acc.get('id')}"
-            safe_name = safe_account_name(account_name)
-            log(f"  - {account_name} (id={acc.get('id')}, server_url={acc.get('server_url')})")
 
+        def clear_account(acc: dict) -> None:
+            account_name = acc.get("name") or f"Account-{acc.get('id')}"
             movies_dir = Path(MOVIES_DIR_TEMPLATE.replace("{XC_NAME}", account_name))
             series_dir = Path(SERIES_DIR_TEMPLATE.replace("{XC_NAME}", account_name))
 
-            if CLEAR_CACHE:
-                acc_cache_dir = CACHE_BASE_DIR / safe_name
-                if acc_cache_dir.exists():
-                    if DRY_RUN:
-                        log(f"[dry-run] Would clear cache for account '{account_name}': {acc_cache_dir}")
-                    else:
-                        shutil.rmtree(acc_cache_dir, ignore_errors=True)
-                        log(f"Cleared cache for account '{account_name}': {acc_cache_dir}")
-                if movies_dir.exists():
-                    if DRY_RUN:
-                        log(f"[dry-run] Would remove movies dir for '{account_name}': {movies_dir}")
-                    else:
-                        shutil.rmtree(movies_dir, ignore_errors=True)
-                        log(f"Removed movies dir for '{account_name}': {movies_dir}")
-                if series_dir.exists():
-                    if DRY_RUN:
-                        log(f"[dry-run] Would remove series dir for '{account_name}': {series_dir}")
-                    else:
-                        shutil.rmtree(series_dir, ignore_errors=True)
-                        log(f"Removed series dir for '{account_name}': {series_dir}")
+            acc_cache_dir = CACHE_BASE_DIR / safe_account_name(account_name)
+            if acc_cache_dir.exists():
+                if DRY_RUN:
+                    log(f"[dry-run] Would clear cache for account '{account_name}': {acc_cache_dir}")
+                else:
+                    shutil.rmtree(acc_cache_dir, ignore_errors=True)
+                    log(f"Cleared cache for account '{account_name}': {acc_cache_dir}")
+            if movies_dir.exists():
+                if DRY_RUN:
+                    log(f"[dry-run] Would remove movies dir for '{account_name}': {movies_dir}")
+                else:
+                    shutil.rmtree(movies_dir, ignore_errors=True)
+                    log(f"Removed movies dir for '{account_name}': {movies_dir}")
+            if series_dir.exists():
+                if DRY_RUN:
+                    log(f"[dry-run] Would remove series dir for '{account_name}': {series_dir}")
+                else:
+                    shutil.rmtree(series_dir, ignore_errors=True)
+                    log(f"Removed series dir for '{account_name}': {series_dir}")
 
+        def export_account(acc: dict) -> None:
+            account_name = acc.get("name") or f"Account-{acc.get('id')}"
+            log(f"  - {account_name} (id={acc.get('id')}, server_url={acc.get('server_url')})")
             export_movies_for_account(DISPATCHARR_BASE_URL, token, acc)
             export_series_for_account(DISPATCHARR_BASE_URL, token, acc)
 
+        # Clear before any account starts: the mkdir memo is shared by all of them
+        if CLEAR_CACHE:
+            for acc in filtered_accounts:
+                clear_account(acc)
+            _CREATED_DIRS.clear()
+
+        # A failing account is logged and doesn't stop the others
+        failed = []
+        with ThreadPoolExecutor(max_workers=min(ACCOUNT_WORKERS, len(filtered_accounts))) as ex:
+            futures = {ex.submit(export_account, acc): acc for acc in filtered_accounts}
+            for fut in as_completed(futures):
+                try:
+                    fut.result()
+                except Exception as e:
+                    acc = futures[fut]
+                    name = acc.get("name") or f"Account-{acc.get('id')}"
+                    log(f"ERROR: export failed for account '{name}': {e}")
+                    failed.append(name)
+        if failed:
+            log(f"=== Export finished with errors for {len(failed)} account(s): {', '.join(failed)} ===")
+            raise SystemExit(1)
+
         log("=== Export finished successfully for all accounts ===")
     except Exception as e:
         log(f"ERROR: {e}")
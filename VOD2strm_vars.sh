@@ -73,6 +73,10 @@ NFO_LANG="en-US"
 # Throttle delay (seconds) between TMDB requests to avoid rate limits
 TMDB_THROTTLE_SEC="0.30"
 
+# TMDB requests allowed back-to-back after an idle spell (token bucket size).
+# Keep BURST + 10/THROTTLE under TMDB's ~40 requests per 10s.
+TMDB_BURST="5"
+
 ########################################
 # Cleanup / cache behaviour
 ########################################
@@ -83,6 +87,17 @@ DELETE_OLD="true"
 # Clear cache (per-account movie/series caches + TMDB cache) before each run
 CLEAR_CACHE="false"
 
+# Hours before a cached provider-info response is refetched, so newly aired
+# episodes show up without CLEAR_CACHE (0 = keep until CLEAR_CACHE)
+PROVIDER_INFO_TTL_HOURS="0"
+
+# Skip series whose Dispatcharr record, provider-info and export settings are
+# unchanged since the last run (no STRM/NFO checks or cleanup walk for them).
+# A skipped series won't restore or clean up files changed by hand inside its
+# folder; CLEAR_CACHE resets this. Series whose TMDB lookups or artwork
+# downloads failed aren't skipped on the next run.
+SKIP_UNCHANGED_SERIES="false"
+
 ########################################
 # Dry-run mode
 ########################################
@@ -101,6 +116,21 @@ DRY_RUN="false"
 #   WARN / ERROR / QUIET -> hide percentage progress lines, keep key events
 LOG_LEVEL="INFO"
 
+########################################
+# Concurrency
+########################################
+
+# Parallel provider-info requests per account (1 = sequential)
+PROVIDER_INFO_WORKERS="16"
+
+# Movies/series exported in parallel (TMDB lookups + artwork downloads).
+# TMDB_THROTTLE_SEC still caps the overall TMDB request rate.
+EXPORT_WORKERS="16"
+
+# Accounts exported in parallel (each with its own worker pools above).
+# Log lines of concurrent accounts interleave.
+ACCOUNT_WORKERS="1"
+
 ########################################
 # Limits for testing
 ########################################
@@ -118,4 +148,8 @@ LIMIT_SERIES="20"
 # Dispatcharr /api/vod/series/<id>/provider-info/ endpoint (which is faster).
 # If that endpoint does not return episode data, it will fall back to using
 # the XC get_series_info endpoint to get episode metadata.  
-ENABLE_XC_EPISODE_FALLBACK="true"
\ No newline at end of file
+ENABLE_XC_EPISODE_FALLBACK="true"
+
+# Hours to reuse a cached XC get_series_info response before refetching
+# (0 = always refetch). Newly aired episodes can lag by up to this long.
+XC_CACHE_TTL_HOURS="0"
\ No newline at end of file
@@ -25,6 +25,30 @@ def human_rel(path: Path, base: Path) -> str:
         return str(path)
 
 
+def sorted_subdirs(root: Path):
+    """
+    Child directories of root, sorted by name. os.scandir's DirEntry.is_dir()
+    uses the dirent type, so no stat() per entry (unlike Path.is_dir()).
+    """
+    with os.scandir(root) as it:
+        return [Path(e.path) for e in sorted(it, key=lambda e: e.name) if e.is_dir()]
+
+
+def has_strm(dir_path) -> bool:
+    """True as soon as one *.strm entry is seen (no full glob)."""
+    with os.scandir(dir_path) as it:
+        return any(e.name.endswith(".strm") for e in it)
+
+
+def has_episode_strm(show_dir: Path) -> bool:
+    """Equivalent of any(show_dir.glob("Season */*.strm")), stopping at the first hit."""
+    with os.scandir(show_dir) as it:
+        for e in it:
+            if e.name.startswith("Season ") and e.is_dir() and has_strm(e.path):
+                return True
+    return False
+
+
 def collect_movie_titles(movies_root: Path, limit: int):
     """
     Collect up to `limit` movie title directories that contain at least one .strm file.
@@ -36,11 +60,10 @@ def collect_movie_titles(movies_root: Path, limit: int):
         return found
 
     # movies_root / <Category> / <Title> / files...
-    for cat_dir in sorted(p for p in movies_root.iterdir() if p.is_dir()):
-        for title_dir in sorted(p for p in cat_dir.iterdir() if p.is_dir()):
+    for cat_dir in sorted_subdirs(movies_root):
+        for title_dir in sorted_subdirs(cat_dir):
             # Does this title dir contain any .strm files?
-            strm_files = list(title_dir.glob("*.strm"))
-            if strm_files:
+            if has_strm(title_dir):
                 found.append(title_dir)
                 if len(found) >= limit:
                     return found
@@ -58,15 +81,14 @@ def collect_series_titles(series_root: Path, limit: int):
         return found
 
     # series_root / <Category> / <Show> / ...
-    for cat_dir in sorted(p for p in series_root.iterdir() if p.is_dir()):
-        for show_dir in sorted(p for p in cat_dir.iterdir() if p.is_dir()):
+    for cat_dir in sorted_subdirs(series_root):
+        for show_dir in sorted_subdirs(cat_dir):
             # Heuristic: treat as a valid series if there is either tvshow.nfo
             # or at least one Season*/.strm
             tvshow_nfo = show_dir / "tvshow.nfo"
             has_tvshow_nfo = tvshow_nfo.exists()
-            has_episode_strm = any(show_dir.glob("Season */*.strm"))
 
-            if has_tvshow_nfo or has_episode_strm:
+            if has_tvshow_nfo or has_episode_strm(show_dir):
                 found.append(show_dir)
                 if len(found) >= limit:
                     return found
@@ -62,10 +62,32 @@ def main() -> int:
     width = max(len(name) for name, _ in VOD_TABLES)
     print("=== Dispatcharr VOD Table Counts ===\n")
 
+    # Two round-trips instead of one per table: find the tables that exist,
+    # then count them all in a single SELECT of scalar subqueries.
+    counts = {}
+    try:
+        cur.execute(
+            "SELECT t FROM unnest(%s) AS t WHERE to_regclass(t) IS NOT NULL;",
+            ([name for name, _ in VOD_TABLES],),
+        )
+        present = [t for (t,) in cur.fetchall()]
+        if present:
+            cur.execute(
+                "SELECT "
+                + ", ".join(f"(SELECT COUNT(*) FROM {t})" for t in present)
+                + ";"
+            )
+            counts = dict(zip(present, cur.fetchone()))
+    except PsycopgError:
+        counts = {}  # fall back to one query per table below
+
     for table_name, desc in VOD_TABLES:
         try:
-            cur.execute(f"SELECT COUNT(*) FROM {table_name};")
-            (count,) = cur.fetchone()
+            if table_name in counts:
+                count = counts[table_name]
+            else:
+                cur.execute(f"SELECT COUNT(*) FROM {table_name};")
+                (count,) = cur.fetchone()
             print(f"{table_name.ljust(width)} : {str(count).rjust(6)}  ({desc})")
         except PsycopgError as e:
             # If a table ever goes missing, show a clean error and keep going
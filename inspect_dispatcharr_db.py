@@ -10,6 +10,10 @@ PG_DB   = "dispatcharr"
 PG_USER = "dispatch"
 PG_PASS = "secret"
 
+# Tables estimated above this many rows show the planner estimate
+# (pg_class.reltuples) instead of a full COUNT(*) scan.
+EXACT_COUNT_MAX = 100_000
+
 # --- Connect ---
 conn = psycopg2.connect(
     host=PG_HOST, port=PG_PORT, dbname=PG_DB,
@@ -29,6 +33,15 @@ cur.execute("""
 """)
 tables = [r['table_name'] for r in cur.fetchall()]
 
+# --- Row estimates for every table in one catalog query ---
+cur.execute("""
+    SELECT c.relname, c.reltuples::BIGINT AS estimate
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = 'public' AND c.relkind = 'r';
+""")
+estimates = {r['relname']: r['estimate'] for r in cur.fetchall()}
+
 print(f"Found {len(tables)} tables in database '{PG_DB}':\n")
 
 # --- Dump up to 10 rows from each ---
@@ -37,9 +50,14 @@ for table in tables:
     print(f"TABLE: {table}")
     print("-" * 80)
 
-    cur.execute(f"SELECT COUNT(*) FROM {table};")
-    count = cur.fetchone()['count']
-    print(f"(Total rows: {count})")
+    estimate = estimates.get(table, -1)
+    if estimate > EXACT_COUNT_MAX:
+        # Never-analyzed tables report -1, so they still get an exact count
+        print(f"(Total rows: ~{estimate} estimated)")
+    else:
+        cur.execute(f"SELECT COUNT(*) FROM {table};")
+        count = cur.fetchone()['count']
+        print(f"(Total rows: {count})")
 
     try:
         cur.execute(f"SELECT * FROM {table} LIMIT 10;")
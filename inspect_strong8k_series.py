@@ -12,6 +12,9 @@ PASSWORD = "Cpfc0603!"  # <-- change to your real password
 TARGET_ACCOUNT_NAME = "Strong 8K"
 PAGE_SIZE = 20
 
+# One keep-alive connection for every call below
+SESSION = requests.Session()
+
 
 def log(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -19,7 +22,7 @@ def log(msg: str) -> None:
 
 def login(base_url: str, username: str, password: str) -> str:
     url = f"{base_url.rstrip('/')}/api/accounts/token/"
-    r = requests.post(url, json={"username": username, "password": password})
+    r = SESSION.post(url, json={"username": username, "password": password})
     r.raise_for_status()
     data = r.json()
     token = data.get("access")
@@ -31,7 +34,7 @@ def login(base_url: str, username: str, password: str) -> str:
 def get_m3u_accounts(base_url: str, token: str):
     url = f"{base_url.rstrip('/')}/api/m3u/accounts/"
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.get(url, headers=headers)
+    r = SESSION.get(url, headers=headers)
     r.raise_for_status()
     data = r.json()
     # /api/m3u/accounts/ might be list or paginated dict
@@ -48,7 +51,7 @@ def get_series_page_for_account(base_url: str, token: str, account_id: int, page
         f"?m3u_account={account_id}&page={page}&page_size={page_size}"
     )
     headers = {"Authorization": f"Bearer {token}"}
-    r = requests.get(url, headers=headers)
+    r = SESSION.get(url, headers=headers)
     r.raise_for_status()
     return r.json()
 
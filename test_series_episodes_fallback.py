@@ -7,6 +7,11 @@ from typing import Any, Dict, List, Optional, Union
 
 import requests
 
+try:
+    from orjson import loads as json_loads  # faster on multi-MB provider-info bodies
+except ImportError:
+    from json import loads as json_loads
+
 # --- CONFIG: set your Dispatcharr admin credentials here ---
 DISPATCHARR_BASE_URL = "http://127.0.0.1:9191"
 DISPATCHARR_USERNAME = "admin"
@@ -15,6 +20,9 @@ DISPATCHARR_PASSWORD = "Cpfc0603!"
 TARGET_ACCOUNT_NAME = "Strong 8K"
 SERIES_PAGE_SIZE = 20
 
+# One keep-alive connection for every call below
+SESSION = requests.Session()
+
 
 def log(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -22,7 +30,7 @@ def log(msg: str) -> None:
 
 def login_dispatcharr() -> str:
     url = f"{DISPATCHARR_BASE_URL.rstrip('/')}/api/accounts/token/"
-    r = requests.post(
+    r = SESSION.post(
         url,
         json={"username": DISPATCHARR_USERNAME, "password": DISPATCHARR_PASSWORD},
         timeout=30,
@@ -52,7 +60,7 @@ def api_get_json(url: str, token: Optional[str] = None) -> Union[Dict[str, Any],
     headers: Dict[str, str] = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
-    r = requests.get(url, headers=headers, timeout=60)
+    r = SESSION.get(url, headers=headers, timeout=60)
 
     # Non-200: do not attempt to parse JSON
     if r.status_code != 200:
@@ -60,7 +68,7 @@ def api_get_json(url: str, token: Optional[str] = None) -> Union[Dict[str, Any],
 
     # Try to parse JSON
     try:
-        data = r.json()
+        data = json_loads(r.content)
     except Exception:
         return {"__status_code": r.status_code, "__text": r.text}
 
@@ -142,9 +150,9 @@ def get_series_info_xc(server_url: str, xc_user: str, xc_pass: str, series_id: i
         f"&action=get_series_info"
         f"&series_id={series_id}"
     )
-    r = requests.get(url, timeout=60)
+    r = SESSION.get(url, timeout=60)
     try:
-        data = r.json()
+        data = json_loads(r.content)
         if isinstance(data, dict):
             return data
         return {"__status_code": r.status_code, "__data": data}